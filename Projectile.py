@@ -1,47 +1,120 @@
-import pygame
-
-class Projectile:
-    def __init__(self, image_path, start_x, start_y, target_unit, cell_size, offset_x, offset_y, speed=5):
-        try:
-            self.image = pygame.image.load(image_path)
-            self.image = pygame.transform.scale(self.image, (48,48)) #change to 48 48
-        except pygame.error as e:
-            print(f"Error loading projectile image: {e}")
-            self.image = None  # Fallback for error handling
-
-        self.x = start_x
-        self.y = start_y
-        self.target_unit = target_unit
-        self.cell_size = cell_size
-        self.offset_x = offset_x
-        self.offset_y = offset_y
-        self.speed = speed
-
-    def update(self):
-        """Move the projectile closer to the target's current position."""
-        # Dynamically calculate the target's current pixel coordinates
-        target_x = self.target_unit.x * self.cell_size + self.offset_x + self.target_unit.image.get_width() // 2
-        target_y = self.target_unit.y * self.cell_size + self.offset_y + self.target_unit.image.get_height() // 2
-
-        # Recalculate direction
-        dx = target_x - self.x
-        dy = target_y - self.y
-        distance = max((dx**2 + dy**2)**0.5, 1e-5)  # Prevent division by zero
-        dir_x = dx / distance
-        dir_y = dy / distance
-
-        # Move the projectile
-        self.x += dir_x * self.speed
-        self.y += dir_y * self.speed
-
-        # Check if the projectile has hit the target
-        return self.has_hit_target(target_x, target_y)
-
-    def has_hit_target(self, target_x, target_y):
-        """Check if the projectile is close enough to the target's current position."""
-        return ((self.x - target_x)**2 + (self.y - target_y)**2)**0.5 < self.speed
-
-    def draw(self, screen):
-        """Render the projectile on the screen."""
-        if self.image:
-            screen.blit(self.image, (self.x, self.y))
+from assets import load_image
+from unit import UNIT_IMAGE_SIZE
+
+PROJECTILE_SIZE = (48, 48)
+CLOSE_PROJECTILE_IMAGE = "Fire Characters/firecc.png"
+RANGED_PROJECTILE_IMAGE = "Fire Characters/firelr.png"
+
+
+class Projectile:
+    # Fixed fields and no per-instance dict: projectiles are small, numerous and recycled by ProjectilePool
+    __slots__ = ("image_path", "x", "y", "target_unit", "cell_size", "offset_x", "offset_y", "speed")
+
+    def __init__(self, image_path, start_x, start_y, target_unit, cell_size, offset_x, offset_y, speed=5):
+        self.reset(image_path, start_x, start_y, target_unit, cell_size, offset_x, offset_y, speed)
+
+    def reset(self, image_path, start_x, start_y, target_unit, cell_size, offset_x, offset_y, speed=5):
+        """(Re)initialise the projectile, for a new one or one taken back out of a pool."""
+        # The sprite is only looked up when the projectile is drawn; the simulation treats it as plain data
+        self.image_path = image_path
+
+        self.x = start_x
+        self.y = start_y
+        self.target_unit = target_unit
+        self.cell_size = cell_size
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.speed = speed
+
+    @property
+    def image(self):
+        """The projectile sprite, shared by every projectile of the same kind."""
+        return load_image(self.image_path, PROJECTILE_SIZE)
+
+    def update(self):
+        """Move the projectile closer to the target's current position."""
+        # Dynamically calculate the target's current pixel coordinates
+        target_x = self.target_unit.x * self.cell_size + self.offset_x + UNIT_IMAGE_SIZE[0] // 2
+        target_y = self.target_unit.y * self.cell_size + self.offset_y + UNIT_IMAGE_SIZE[1] // 2
+
+        # Recalculate direction
+        dx = target_x - self.x
+        dy = target_y - self.y
+        distance = max((dx**2 + dy**2)**0.5, 1e-5)  # Prevent division by zero
+        dir_x = dx / distance
+        dir_y = dy / distance
+
+        # Move the projectile
+        self.x += dir_x * self.speed
+        self.y += dir_y * self.speed
+
+        # Check if the projectile has hit the target
+        return self.has_hit_target(target_x, target_y)
+
+    def has_hit_target(self, target_x, target_y):
+        """Check if the projectile is close enough to the target's current position."""
+        return ((self.x - target_x)**2 + (self.y - target_y)**2)**0.5 < self.speed
+
+    def draw(self, screen):
+        """Render the projectile on the screen and return the rect it covers."""
+        if self.image:
+            return screen.blit(self.image, (self.x, self.y))
+        return None
+
+
+class ProjectilePool:
+    """The projectiles in flight, kept in a compact list, plus spent ones waiting to be reused.
+
+    A projectile that hits is swapped with the last live one and popped, so removal is O(1)
+    and the spent record goes on a free list instead of to the garbage collector.
+    """
+
+    def __init__(self):
+        self.live = []
+        self._free = []
+
+    def spawn(self, image_path, start_x, start_y, target_unit, cell_size, offset_x, offset_y, speed=5):
+        """Launch a projectile, reusing a spent one when there is one."""
+        if self._free:
+            projectile = self._free.pop()
+            projectile.reset(image_path, start_x, start_y, target_unit, cell_size, offset_x, offset_y, speed)
+        else:
+            projectile = Projectile(image_path, start_x, start_y, target_unit, cell_size, offset_x, offset_y, speed)
+        self.live.append(projectile)
+        return projectile
+
+    def track(self, unit):
+        """Nothing to do: pooled projectiles read their target's position straight from the unit."""
+
+    def _release(self, index):
+        live = self.live
+        projectile = live[index]
+        last = live.pop()
+        if last is not projectile:
+            live[index] = last
+        projectile.target_unit = None  # Don't keep a dead unit alive from the free list
+        self._free.append(projectile)
+
+    def update(self):
+        """Advance every projectile once and recycle those that hit."""
+        live = self.live
+        i = 0
+        while i < len(live):
+            if live[i].update():
+                self._release(i)  # The last projectile moves into slot i and is updated next
+            else:
+                i += 1
+
+    def draw(self, screen):
+        """Draw every live projectile and return the rects covered."""
+        return [rect for rect in (projectile.draw(screen) for projectile in self.live) if rect]
+
+    def clear(self):
+        while self.live:
+            self._release(len(self.live) - 1)
+
+    def __iter__(self):
+        return iter(self.live)
+
+    def __len__(self):
+        return len(self.live)
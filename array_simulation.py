@@ -0,0 +1,246 @@
+import numpy as np
+
+from attack_range import RANGE_CLASSES
+from simulation import Simulation, INITIAL_PAUSE, ACTION_INTERVAL
+
+RANGE_CODES = {range_class: code for code, range_class in enumerate(RANGE_CLASSES)}
+CRIT_MULTIPLIER = 1.5
+MANA_ON_HIT_RATIO = 0.3  # Share of mana_regen a unit gains when it is hit
+
+
+class ArraySimulation(Simulation):
+    """Struct-of-arrays combat engine: every per-tick rule runs as batched NumPy operations.
+
+    Units are added exactly as with Simulation; their stats are copied into arrays on the
+    first step and written back with sync_to_units(). Differences from the object engine:
+    attacks within one tick resolve simultaneously, a mover heads straight for the enemy that
+    was nearest at the start of the step and waits if that cell is taken instead of pathing
+    around, and no cosmetic projectiles are spawned. So a seed can end differently here.
+    """
+
+    def __init__(self, board=None, clock=None, seed=None, log=None):
+        super().__init__(board, clock, seed, log)
+        self.np_rng = np.random.default_rng(seed)
+        self._built = False
+
+    def _build_arrays(self):
+        """Copy the placed units into parallel arrays, one row per unit."""
+        self.rows = units = list(self.units)  # Row order; units stay in their rows after they die
+        self.health = np.array([u.health for u in units], dtype=np.float64)
+        self.max_health = np.array([u.max_health for u in units], dtype=np.float64)
+        self.mana = np.array([u.current_mana for u in units], dtype=np.float64)
+        self.mana_pool = np.array([u.mana_pool for u in units], dtype=np.float64)
+        self.mana_regen = np.array([u.mana_regen for u in units], dtype=np.float64)
+        self.has_mana = np.array([u.hasMana for u in units], dtype=bool)
+        self.x = np.array([u.x for u in units], dtype=np.int64)
+        self.y = np.array([u.y for u in units], dtype=np.int64)
+        self.last_attack_time = np.array([u.last_attack_time for u in units], dtype=np.float64)
+        self.attack_interval = np.array([u.attack_interval for u in units], dtype=np.float64)
+        self.attack_damage = np.array([u.attack_damage for u in units], dtype=np.float64)
+        self.crit_chance = np.array([u.crit_chance for u in units], dtype=np.float64)
+        self.range_code = np.array([RANGE_CODES[u.attack_range] for u in units], dtype=np.intp)
+        # Each range class reaches a rectangle; its half-width and half-height by range code
+        bounds = self.board.range_masks.bounds
+        self.reach_x = np.array([bounds[range_class][0] for range_class in RANGE_CLASSES], dtype=np.int64)
+        self.reach_y = np.array([bounds[range_class][1] for range_class in RANGE_CLASSES], dtype=np.int64)
+        self.has_ability = np.array([u.ability is not None for u in units], dtype=bool)
+        self.stunned_until = np.array([u.stunned_until for u in units], dtype=np.float64)
+        self._row = {id(u): i for i, u in enumerate(units)}
+
+        # Teamless units get a team of their own so "anyone but me" still holds
+        team_ids = [u.team if u.team is not None else -(i + 1) for i, u in enumerate(units)]
+        self.team = np.array(team_ids, dtype=np.int64)
+        self._built = True
+
+    def _range_pairs(self, rows, alive):
+        """(attacker, target) row arrays pairing each of rows with every live enemy it can hit.
+
+        Live units are sorted by column and then row, so the cells a range rectangle covers in
+        one column are a single slice; only the few columns in reach are looked at, never all n.
+        """
+        width, height = self.board.grid_width, self.board.grid_height
+        live = np.flatnonzero(alive)
+        keys = self.x[live] * height + self.y[live]
+        order = np.argsort(keys)
+        live, keys = live[order], keys[order]
+
+        code = self.range_code[rows]
+        reach_x, reach_y = self.reach_x[code][:, None], self.reach_y[code][:, None]
+        dx = np.arange(-self.reach_x.max(), self.reach_x.max() + 1)[None, :]
+        column = self.x[rows][:, None] + dx
+        top = np.maximum(self.y[rows][:, None] - reach_y, 0)
+        bottom = np.minimum(self.y[rows][:, None] + reach_y, height - 1)
+        start = np.searchsorted(keys, column * height + top, side="left")
+        end = np.searchsorted(keys, column * height + bottom, side="right")
+        counts = np.where((np.abs(dx) <= reach_x) & (column >= 0) & (column < width), end - start, 0).ravel()
+
+        # Expand every (attacker, column) slice into its pairs
+        total = counts.sum()
+        slice_start = np.repeat(start.ravel(), counts)
+        within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        targets = live[slice_start + within]
+        attackers = np.repeat(np.repeat(rows, dx.size), counts)
+        hostile = self.team[attackers] != self.team[targets]  # Also drops each unit's own cell
+        return attackers[hostile], targets[hostile]
+
+    def execute_movement(self):
+        """Step every idle unit one cell toward its nearest enemy, in unit order like the object engine."""
+        now = self.clock.now
+        alive = self.health > 0
+        candidates = np.flatnonzero(alive & (self.stunned_until <= now))
+        if candidates.size == 0:
+            return
+        in_combat = np.zeros(len(self.rows), dtype=bool)
+        in_combat[self._range_pairs(candidates, alive)[0]] = True
+        movers = candidates[~in_combat[candidates]]
+        if movers.size == 0:
+            return
+
+        # Nearest live enemy of each mover, the first in unit order on ties
+        live = np.flatnonzero(alive)
+        dx = self.x[live][None, :] - self.x[movers][:, None]
+        dy = self.y[live][None, :] - self.y[movers][:, None]
+        distance = np.abs(dx) + np.abs(dy) + ((dx != 0) & (dy != 0))  # Diagonal costs one extra
+        hostile = self.team[movers][:, None] != self.team[live][None, :]
+        distance = np.where(hostile, distance, np.iinfo(np.int64).max)
+        has_target = hostile.any(axis=1)
+        movers, nearest = movers[has_target], live[distance.argmin(axis=1)[has_target]]
+        if movers.size == 0:
+            return
+        new_x = np.clip(self.x[movers] + np.sign(self.x[nearest] - self.x[movers]), 0, self.board.grid_width - 1)
+        new_y = np.clip(self.y[movers] + np.sign(self.y[nearest] - self.y[movers]), 0, self.board.grid_height - 1)
+
+        # Movers go in unit order, as in the object engine: one whose reach an enemy has just
+        # stepped into stays to fight, and a cell is taken only if it is free at the mover's turn,
+        # so a mover can follow a unit that has just stepped away
+        width = self.board.grid_width
+        cells = (self.y * width + self.x).tolist()
+        occupied = {cells[i] for i in live.tolist()}
+        code = self.range_code[movers]
+        arrived = []  # (x, y, team) of this step's movers, in the order they moved
+        moved = []
+        for k, (i, x, y, reach_x, reach_y, team, cell) in enumerate(zip(
+                movers.tolist(), self.x[movers].tolist(), self.y[movers].tolist(), self.reach_x[code].tolist(),
+                self.reach_y[code].tolist(), self.team[movers].tolist(), (new_y * width + new_x).tolist())):
+            if any(other != team and abs(ax - x) <= reach_x and abs(ay - y) <= reach_y for ax, ay, other in arrived):
+                continue
+            if cell not in occupied:
+                occupied.discard(cells[i])
+                occupied.add(cell)
+                arrived.append((cell % width, cell // width, team))
+                moved.append(k)
+        self.x[movers[moved]] = new_x[moved]
+        self.y[movers[moved]] = new_y[moved]
+
+    def start_combat(self):
+        """Every ready unit hits the enemy in range on the lowest cell, as Simulation does; damage,
+        crits and mana are applied in bulk. Only ready, unstunned units look for targets."""
+        now = self.clock.now
+        alive = self.health > 0
+        ready = np.flatnonzero(alive & (now - self.last_attack_time >= self.attack_interval)
+                               & (self.stunned_until <= now))
+        if ready.size == 0:
+            return
+        attackers, targets = self._range_pairs(ready, alive)
+        if attackers.size == 0:
+            return
+        # Sort each attacker's targets by cell and keep the first
+        order = np.lexsort((self.y[targets] * self.board.grid_width + self.x[targets], attackers))
+        attackers, targets = attackers[order], targets[order]
+        first = np.ones(attackers.size, dtype=bool)
+        first[1:] = attackers[1:] != attackers[:-1]
+        attackers, targets = attackers[first], targets[first]
+
+        is_critical = self.np_rng.random(attackers.size) < self.crit_chance[attackers]
+        damage = self.attack_damage[attackers]
+        # Unit.attack_enemy applies the (possibly critical) hit and then the base hit again
+        total_damage = np.where(is_critical, damage * CRIT_MULTIPLIER, damage) + damage
+        np.subtract.at(self.health, targets, total_damage)
+        self.last_attack_time[attackers] = now
+
+        self.mana[attackers] = np.minimum(self.mana[attackers] + self.mana_regen[attackers],
+                                          self.mana_pool[attackers])
+        gains = (self.health[targets] > 0) & self.has_mana[targets]
+        np.add.at(self.mana, targets[gains], self.mana_regen[targets[gains]] * MANA_ON_HIT_RATIO)
+        np.minimum(self.mana, self.mana_pool, out=self.mana)
+
+        casting = self.has_ability[attackers] & (self.mana[attackers] == self.mana_pool[attackers])
+        for attacker, target in zip(attackers[casting], targets[casting]):
+            self._cast_ability(attacker, target, now)
+
+    def _cast_ability(self, attacker, target, now):
+        """Abilities are bespoke Python code, so casters round-trip through their Unit objects."""
+        owner, enemy = self.rows[attacker], self.rows[target]
+        for i in (attacker, target):
+            self._sync_unit(i)
+        if owner.needsTarget:
+            owner.ability.trigger(enemy, now, self.effects, self.log)
+        else:
+            owner.ability.trigger(now, self.effects, self.log)
+        for i in (attacker, target):
+            self._load_unit(i)
+
+    def update_effects(self):
+        """Status effects work on Unit objects, so each due tick round-trips its target's row."""
+        now = self.clock.now
+        for effect in self.effects.due(now):
+            i = self._row[id(effect.target)]
+            self._sync_unit(i)
+            self.effects.fire(effect, now)
+            self._load_unit(i)
+
+    def step(self):
+        """Advance one clock tick with the same pacing as Simulation.step."""
+        if not self._built:
+            self._build_arrays()
+        now = self.clock.tick()
+        if now < INITIAL_PAUSE:
+            return
+
+        self.update_effects()
+
+        if now - self.last_action_time >= self.action_interval:
+            self.action_interval = ACTION_INTERVAL
+            self.last_action_time = now
+            self.execute_movement()
+
+        self.start_combat()
+
+    def run(self, max_time=120.0):
+        """Run headless to completion and write the final state back onto the units."""
+        elapsed = super().run(max_time)
+        self.sync_to_units()
+        return elapsed
+
+    def alive_teams(self):
+        if not self._built:
+            return super().alive_teams()
+        alive = self.health > 0
+        return {unit.team if unit.team is not None else id(unit)
+                for unit, is_alive in zip(self.rows, alive) if is_alive}
+
+    def _sync_unit(self, i):
+        """Array row -> Unit object."""
+        unit = self.rows[i]
+        unit.health = float(self.health[i])
+        unit.current_mana = float(self.mana[i])
+        unit.x, unit.y = int(self.x[i]), int(self.y[i])
+        unit.last_attack_time = float(self.last_attack_time[i])
+        unit.attack_damage = float(self.attack_damage[i])
+        unit.stunned_until = float(self.stunned_until[i])
+
+    def _load_unit(self, i):
+        """Unit object -> array row, for the fields abilities and status effects change."""
+        unit = self.rows[i]
+        self.health[i] = unit.health
+        self.mana[i] = unit.current_mana
+        self.attack_damage[i] = unit.attack_damage
+        self.stunned_until[i] = unit.stunned_until
+
+    def sync_to_units(self):
+        """Copy array state back onto the Unit objects and rebuild the board grid."""
+        if not self._built:
+            return
+        for i in range(len(self.rows)):
+            self._sync_unit(i)
+        self.board.reset_units(unit for unit in self.rows if unit.health > 0)
@@ -0,0 +1,60 @@
+import os
+
+import pygame
+
+# Process-wide image cache keyed by (path, size); size None is the image as stored on disk
+_images = {}
+_atlas = None  # Optional SpriteAtlas consulted before any individual file
+
+
+def sprite_key(path):
+    """Default atlas key for a sprite path: the lower-case file stem, e.g. 'Fire Characters/phe1.png' -> 'phe1'."""
+    return os.path.splitext(os.path.basename(path))[0].lower()
+
+
+def use_atlas(atlas):
+    """Serve sprites of the atlas' cell size from the packed atlas instead of separate files."""
+    global _atlas
+    _atlas = atlas
+    clear_cache()
+
+
+def load_image(path, size=None, key=None):
+    """Return a shared surface for path scaled to size, touching the disk only on the first request.
+
+    key names the sprite in the atlas when it differs from the file stem (see sprite_key).
+
+    Surfaces are converted to the display format when a window exists so blits are fast.
+    Missing or unreadable files are remembered as None and reported once.
+    """
+    cache_key = (path, size)
+    if cache_key in _images:
+        return _images[cache_key]
+
+    # Sprites packed in the atlas are sub-rects of one shared surface
+    image = _atlas.sprite(key or sprite_key(path)) if _atlas is not None and size == _atlas.cell_size else None
+    if image is None and size is None:
+        try:
+            image = pygame.image.load(path)
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Could not load image {path}: {e}")
+            image = None
+    elif image is None:
+        original = load_image(path)  # Every size of one file shares a single disk read
+        image = pygame.transform.scale(original, size) if original is not None else None
+
+    _images[cache_key] = image
+    return image
+
+
+def preload(requests):
+    """Warm the cache with (path, size) or (path, size, key) requests so the first frames don't stall on disk I/O."""
+    for request in requests:
+        load_image(*request)
+
+
+def clear_cache():
+    """Drop every cached surface, e.g. after the display mode changes."""
+    _images.clear()
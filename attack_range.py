@@ -0,0 +1,67 @@
+from functools import lru_cache
+
+RANGE_CLASSES = ("close", "medium", "long")
+KNIGHT_MOVES = frozenset([(2, 1), (1, 2)])  # Absolute knight offsets that long range can also hit
+
+
+def normalize_range(attack_range):
+    """Map spellings like 'Medium' or ' close ' onto a known range class."""
+    name = attack_range.strip().lower()
+    if name not in RANGE_CLASSES:
+        raise ValueError(f"Unknown attack range {attack_range!r}; expected one of {RANGE_CLASSES}")
+    return name
+
+
+def _reaches(range_class, adx, ady):
+    """The range rules themselves; only used while compiling lookup tables."""
+    if range_class == "close":
+        return adx <= 1 and ady <= 1
+    if range_class == "medium":
+        return adx <= 2 and ady <= 2
+    return adx <= 3 or (adx, ady) in KNIGHT_MOVES
+
+
+# No range class reaches past |dx| = 3, and past |dy| = 2 only long range does, where the row no
+# longer matters. So every distance at or beyond the last row/column behaves like it, and these
+# small tables cover boards of any size.
+TABLE_WIDTH = 5  # |dx| 0..3, then "4 or more"
+TABLE_HEIGHT = 4  # |dy| 0..2, then "3 or more"
+# Furthest (|dx|, |dy|) each class can reach; None is the whole column
+RANGE_BOUNDS = {"close": (1, 1), "medium": (2, 2), "long": (3, None)}
+
+# Lookup tables indexed [min(|dy|, TABLE_HEIGHT - 1)][min(|dx|, TABLE_WIDTH - 1)]
+_TABLES = {
+    range_class: tuple(tuple(_reaches(range_class, adx, ady) for adx in range(TABLE_WIDTH))
+                       for ady in range(TABLE_HEIGHT))
+    for range_class in RANGE_CLASSES
+}
+
+
+def in_range(range_class, dx, dy):
+    """True if a unit of this range class can hit something dx, dy cells away."""
+    return _TABLES[range_class][min(abs(dy), TABLE_HEIGHT - 1)][min(abs(dx), TABLE_WIDTH - 1)]
+
+
+class RangeMasks:
+    """Range classes compiled for one board size. Every class reaches exactly the rectangle
+    inside its RANGE_BOUNDS, so its reach is stored as that rectangle clipped to the board."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.bounds = {}  # Range class -> (max |dx|, max |dy|) on this board
+        for range_class, (max_dx, max_dy) in RANGE_BOUNDS.items():
+            max_dx = min(max_dx, width - 1)
+            max_dy = height - 1 if max_dy is None else min(max_dy, height - 1)
+            self.bounds[range_class] = (max_dx, max_dy)
+
+    @staticmethod
+    def table(range_class):
+        """Rows of booleans indexed [min(|dy|, TABLE_HEIGHT - 1)][min(|dx|, TABLE_WIDTH - 1)]."""
+        return _TABLES[range_class]
+
+
+@lru_cache(maxsize=16)
+def range_masks(width, height):
+    """Shared RangeMasks for a board size."""
+    return RangeMasks(width, height)
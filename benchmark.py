@@ -0,0 +1,253 @@
+# benchmark.py
+#
+# Headless benchmarks for the combat and render hot paths. Every case runs on seeded
+# fights across a sweep of unit counts and board sizes, writes its timings as JSON and
+# can compare them with a saved baseline:
+#
+#     python benchmark.py                                  # full sweep -> benchmark.json
+#     cp benchmark.json benchmark_baseline.json            # keep it as the baseline
+#     python benchmark.py --baseline benchmark_baseline.json
+#
+# Times are per operation: one call for the simulation phases and board draws, one unit
+# for find_nearest_target and place_unit, one projectile for Projectile.update.
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Off-screen drawing needs no window
+
+import pygame
+
+import unit as unit_module
+from player_board import PlayerBoard
+from simulation import Simulation, HEADLESS_SCREEN_SIZE, INITIAL_PAUSE
+
+try:
+    from projectile_batch import ProjectileBatch
+except ImportError:  # NumPy is optional; the batch case is skipped without it
+    ProjectileBatch = None
+
+UNIT_COUNTS = (2, 10, 50, 100, 250, 500, 1000)
+BOARD_SIZES = ((12, 4), (32, 16), (64, 32), (100, 100))
+SPECIES = ("Dragon", "Phoenix", "Lion", "Salamander", "Scorpion")
+ROUNDS = 20  # Calls per timed run
+REPEAT = 3  # Timed runs per case; the median is compared
+TOLERANCE = 0.10  # Slowdown over the baseline reported as a regression
+
+
+def build_fight(grid_width, grid_height, count, seed=0):
+    """A seeded fight with count units, team 0 scattered over the top half and team 1 over the bottom."""
+    board = PlayerBoard(*HEADLESS_SCREEN_SIZE, grid_width=grid_width, grid_height=grid_height)
+    simulation = Simulation(board, seed=seed)
+    rng = random.Random(seed)
+    half = grid_height // 2
+    for team, rows, size in ((0, range(half), count // 2), (1, range(half, grid_height), count - count // 2)):
+        cells = rng.sample([(x, y) for y in rows for x in range(grid_width)], size)
+        for i, (x, y) in enumerate(cells):
+            simulation.add_unit(getattr(unit_module, SPECIES[i % len(SPECIES)])(), x, y, team=team)
+    simulation.clock.ticks = round(INITIAL_PAUSE * simulation.clock.tick_rate)  # Past the opening pause
+    return simulation
+
+
+def fits(grid_width, grid_height, count):
+    """Whether each team's share of count fits in its half of the board."""
+    return count - count // 2 <= grid_width * (grid_height // 2)
+
+
+# Each case prepares whatever it needs untimed and returns the timed part, which
+# returns the number of operations it performed.
+
+def bench_execute_movement(simulation, rounds):
+    def run():
+        for _ in range(rounds):
+            simulation.execute_movement()
+        return rounds
+    return run
+
+
+def bench_start_combat(simulation, rounds):
+    def run():
+        for _ in range(rounds):
+            simulation.clock.tick()  # Let attack timers come due as they would in a match
+            simulation.start_combat()
+        return rounds
+    return run
+
+
+def bench_find_nearest_target(simulation, rounds):
+    units = list(simulation.units)
+
+    def run():
+        for _ in range(rounds):
+            for unit in units:
+                simulation.find_nearest_target(unit)
+        return rounds * len(units)
+    return run
+
+
+def bench_place_unit(simulation, rounds):
+    board = simulation.board
+    rng = random.Random(1)
+    moves = [(unit, rng.randrange(board.grid_width), rng.randrange(board.grid_height))
+             for _ in range(rounds) for unit in simulation.units]
+
+    def run():
+        for unit, x, y in moves:
+            board.place_unit(unit, x, y)
+        return len(moves)
+    return run
+
+
+def bench_projectile_update(simulation, rounds):
+    rng = random.Random(1)
+    units = list(simulation.units)
+    projectiles = [simulation.spawn_projectile(unit, rng.choice(units)) for unit in units]
+
+    def run():
+        for _ in range(rounds):
+            for projectile in projectiles:
+                projectile.update()
+        return rounds * len(projectiles)
+    return run
+
+
+def bench_projectile_batch_update(simulation, rounds):
+    rng = random.Random(1)
+    units = list(simulation.units)
+    simulation.projectiles = ProjectileBatch()
+    for unit in units:
+        simulation.spawn_projectile(unit, rng.choice(units))
+
+    def run():
+        ops = 0
+        for _ in range(rounds):
+            ops += len(simulation.projectiles)  # Hits leave the batch, so count what was updated
+            simulation.projectiles.update()
+        return ops
+    return run
+
+
+def bench_board_draw(simulation, rounds):
+    surface = pygame.Surface(HEADLESS_SCREEN_SIZE)
+    simulation.board.draw(surface)  # Build the static layer and load sprites before timing
+
+    def run():
+        for _ in range(rounds):
+            simulation.board.draw(surface)
+        return rounds
+    return run
+
+
+CASES = {
+    "execute_movement": bench_execute_movement,
+    "start_combat": bench_start_combat,
+    "find_nearest_target": bench_find_nearest_target,
+    "place_unit": bench_place_unit,
+    "projectile_update": bench_projectile_update,
+    "board_draw": bench_board_draw,
+}
+if ProjectileBatch is not None:
+    CASES["projectile_batch_update"] = bench_projectile_batch_update
+
+
+def run_case(name, grid_width, grid_height, count, rounds=ROUNDS, repeat=REPEAT):
+    """Time one case on fresh fights and summarise the time per operation in microseconds."""
+    per_op = []
+    for _ in range(repeat):
+        run = CASES[name](build_fight(grid_width, grid_height, count), rounds)
+        start = time.perf_counter()
+        ops = run()
+        per_op.append((time.perf_counter() - start) / max(ops, 1) * 1e6)
+    return {
+        "case": name,
+        "board": f"{grid_width}x{grid_height}",
+        "units": count,
+        "ops": ops,
+        "median_us": statistics.median(per_op),
+        "best_us": min(per_op),
+    }
+
+
+def result_key(result):
+    return result["case"], result["board"], result["units"]
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Print each case against the baseline; returns the keys that got slower than the tolerance."""
+    previous = {result_key(result): result for result in baseline["results"]}
+    regressions = []
+    print(f"{'case':<24}{'board':>7}{'units':>7}{'baseline us':>14}{'now us':>12}{'change':>9}")
+    for result in results:
+        old = previous.get(result_key(result))
+        if old is None:
+            continue
+        change = result["median_us"] / old["median_us"] - 1 if old["median_us"] else 0.0
+        flag = "  SLOWER" if change > tolerance else ""
+        print(f"{result['case']:<24}{result['board']:>7}{result['units']:>7}"
+              f"{old['median_us']:14.2f}{result['median_us']:12.2f}{change:+9.1%}{flag}")
+        if change > tolerance:
+            regressions.append(result_key(result))
+    return regressions
+
+
+def parse_board(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the combat and render hot paths headlessly.")
+    parser.add_argument("--cases", default=",".join(CASES), help="comma-separated cases to run")
+    parser.add_argument("--units", default=",".join(map(str, UNIT_COUNTS)), help="comma-separated unit counts")
+    parser.add_argument("--boards", default=",".join(f"{w}x{h}" for w, h in BOARD_SIZES),
+                        help="comma-separated board sizes, e.g. 12x4,32x16")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help="calls per timed run")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed runs per case")
+    parser.add_argument("-o", "--output", default="benchmark.json", help="where to write the results")
+    parser.add_argument("--baseline", help="earlier results to compare against")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="slowdown reported as a regression")
+    args = parser.parse_args()
+
+    pygame.init()
+
+    boards = [parse_board(text) for text in args.boards.split(",")]
+    counts = [int(text) for text in args.units.split(",")]
+    results = []
+    for name in args.cases.split(","):
+        for grid_width, grid_height in boards:
+            for count in counts:
+                if not fits(grid_width, grid_height, count):
+                    continue
+                result = run_case(name, grid_width, grid_height, count, args.rounds, args.repeat)
+                results.append(result)
+                print(f"{name:<24}{result['board']:>7}{count:>7}{result['median_us']:12.2f} us/op")
+
+    with open(args.output, "w") as file:
+        json.dump({
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "rounds": args.rounds,
+            "repeat": args.repeat,
+            "results": results,
+        }, file, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} case(s) slower than the baseline by more than {args.tolerance:.0%}")
+            sys.exit(1)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
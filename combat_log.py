@@ -0,0 +1,120 @@
+import json
+import sys
+from collections import deque, namedtuple
+
+# Levels, ordered like the logging module's
+DEBUG = 10
+INFO = 20
+
+# Event kinds
+ATTACK = "attack"
+CRIT = "crit"
+MANA_GAIN = "mana_gain"
+ABILITY = "ability"
+BURN = "burn"
+DEATH = "death"
+
+CombatEvent = namedtuple("CombatEvent", "time level kind source target amount")
+
+
+def format_event(event):
+    """One human-readable line per event, in the style of the old print statements."""
+    source = event.source.name if event.source is not None else ""
+    target = event.target.name if event.target is not None else ""
+    if event.kind == ATTACK:
+        return f"{source} attacks {target} for {event.amount:.2f} damage!"
+    if event.kind == CRIT:
+        return f"{source} lands a critical hit on {target}! (Critical Hit!)"
+    if event.kind == MANA_GAIN:
+        resource_name = "mana" if event.source.hasMana else "rage"
+        return f"{source} gains {resource_name}: {event.amount:.2f}/{event.source.mana_pool}"
+    if event.kind == ABILITY:
+        return f"{source}'s ability activated!" + (f" Target: {target}" if target else "")
+    if event.kind == BURN:
+        return f"{target} takes {event.amount:.2f} burn damage. Health: {event.target.health:.2f}"
+    if event.kind == DEATH:
+        return f"{source} has been defeated!"
+    return f"{event.kind}: {source} {target} {event.amount}"
+
+
+class ConsoleWriter:
+    """Print each event as a line of text."""
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+
+    def write(self, event):
+        print(format_event(event), file=self.stream)
+
+
+class FileWriter:
+    """Append each event to a file as one JSON object per line."""
+
+    def __init__(self, path):
+        self.file = open(path, "a")
+
+    def write(self, event):
+        record = {
+            "time": round(event.time, 4),
+            "level": event.level,
+            "kind": event.kind,
+            "source": event.source.name if event.source is not None else None,
+            "target": event.target.name if event.target is not None else None,
+            "amount": event.amount,
+        }
+        self.file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class CombatLog:
+    """Structured combat events kept in an in-memory ring buffer and passed on to opt-in writers.
+
+    Hot paths check `log.enabled` before building an event, so the NULL_LOG default costs
+    a single attribute read.
+    """
+
+    enabled = True
+
+    def __init__(self, level=INFO, capacity=1000, writers=()):
+        self.level = level
+        self.events = deque(maxlen=capacity)  # Most recent events, oldest dropped first
+        self.writers = list(writers)
+
+    def emit(self, time, level, kind, source, target=None, amount=None):
+        if level < self.level:
+            return
+        event = CombatEvent(time, level, kind, source, target, amount)
+        self.events.append(event)
+        for writer in self.writers:
+            writer.write(event)
+
+    def add_writer(self, writer):
+        self.writers.append(writer)
+
+    def recent(self, count=None):
+        """The last `count` events (all buffered events if count is None), oldest first."""
+        events = list(self.events)
+        return events if count is None else events[-count:]
+
+
+class NullLog:
+    """Logging switched off: nothing is built, stored or written."""
+
+    enabled = False
+    level = INFO
+    events = ()
+    writers = ()
+
+    def emit(self, time, level, kind, source, target=None, amount=None):
+        pass
+
+    def add_writer(self, writer):
+        raise ValueError("NullLog discards events; use a CombatLog to attach writers")
+
+    def recent(self, count=None):
+        return []
+
+
+NULL_LOG = NullLog()
@@ -0,0 +1,132 @@
+import heapq
+import itertools
+
+from simulation import Simulation, INITIAL_PAUSE, ACTION_INTERVAL
+
+# Order of work inside one tick, matching Simulation.step; attacks due on the same tick
+# then run in unit registry order, as Simulation.start_combat walks them
+PHASE_MOVE = 0
+PHASE_ATTACK = 1
+
+
+class EventSimulation(Simulation):
+    """Headless engine that jumps from event to event instead of polling every tick.
+
+    Each unit's next possible attack and the next movement step sit in a priority queue
+    keyed by clock tick; status effects bring their own due times. step() jumps the
+    clock straight to the next tick with work and does only that work, so a fight costs
+    roughly one queue operation per attack. A unit with nobody in range sleeps until
+    the next movement step. Outcomes match Simulation for the same seed; cosmetic
+    projectiles are skipped.
+    """
+
+    def __init__(self, board=None, clock=None, seed=None, log=None):
+        super().__init__(board, clock, seed, log)
+        self._queue = []
+        self._order = itertools.count()
+        self._waiting = []  # Units with no target in range, re-queued after the next movement step
+        self._pause_tick = self._first_tick(0.0, INITIAL_PAUSE, from_tick=0)
+        self._started = False
+
+    def add_unit(self, unit, x, y, team=None):
+        super().add_unit(unit, x, y, team)
+        if self._started:
+            self._push_attack(unit)
+
+    def _first_tick(self, since, interval, from_tick=None):
+        """Earliest tick at which now - since >= interval, using the same float maths as the tick engine."""
+        dt = self.clock.dt
+        start = self.clock.ticks if from_tick is None else from_tick
+        tick = max(start, int((since + interval) / dt) - 1)
+        while tick * dt - since < interval:
+            tick += 1
+        return tick
+
+    def _push(self, tick, phase, unit=None):
+        heapq.heappush(self._queue, (tick, phase, next(self._order), unit))
+
+    def _push_attack(self, unit):
+        tick = self._first_tick(unit.last_attack_time, unit.attack_interval)
+        self._push(max(tick, self._pause_tick), PHASE_ATTACK, unit)
+
+    def _start(self):
+        self._started = True
+        self._push(self._first_tick(self.last_action_time, self.action_interval, from_tick=0), PHASE_MOVE)
+        for unit in self.units:
+            self._push_attack(unit)
+
+    def _next_tick(self):
+        """The next tick with queued work or a status effect coming due."""
+        ticks = []
+        if self._queue:
+            ticks.append(self._queue[0][0])
+        effect_due = self.effects.next_due()
+        if effect_due is not None:
+            ticks.append(max(self._first_tick(effect_due, 0.0), self._pause_tick))
+        return min(ticks) if ticks else None
+
+    def step(self):
+        """Jump to the next tick that has work and process all of it."""
+        if not self._started:
+            self._start()
+        tick = self._next_tick()
+        if tick is None:
+            self.clock.tick()  # Nothing left to happen; just let time pass
+            return
+        self.clock.ticks = tick
+        now = self.clock.now
+
+        self.update_effects()
+        attackers = []
+        while self._queue and self._queue[0][0] == tick:
+            _, phase, _, unit = heapq.heappop(self._queue)
+            if phase == PHASE_MOVE:
+                self._move(now)
+            elif unit.health > 0:  # Skip units that died since this event was queued
+                attackers.append(unit)
+        attackers.sort(key=self.units.order)
+        for unit in attackers:
+            self._attack(unit, now)
+        self.end_tick()
+
+    def _move(self, now):
+        self.action_interval = ACTION_INTERVAL  # Update interval after the initial pause
+        self.last_action_time = now
+        self.execute_movement()
+        self._push(self._first_tick(now, self.action_interval, from_tick=self.clock.ticks + 1), PHASE_MOVE)
+
+        # Anyone who had nothing in range gets another look from their new positions
+        waiting, self._waiting = self._waiting, []
+        for unit in waiting:
+            if unit.health > 0:
+                self._push_attack(unit)
+
+    def _attack(self, unit, now):
+        if unit.health <= 0:
+            return  # Died since this event was queued
+        if unit.is_stunned(now):
+            self._push(self._first_tick(unit.stunned_until, 0.0), PHASE_ATTACK, unit)
+            return
+
+        target = self.board.enemy_in_range(unit)
+        if target is None:
+            self._waiting.append(unit)
+            return
+
+        unit.attack_enemy(target, now, self.effects, self.rng, self.log)
+        if target.health <= 0:  # Handle target death
+            self.handle_unit_death(target)
+        self._push_attack(unit)
+
+    def run(self, max_time=120.0):
+        """Process events until the fight ends or the next event lies beyond max_time."""
+        if not self._started:
+            self._start()
+        limit = self._first_tick(0.0, max_time, from_tick=0)
+        while not self.is_finished():
+            tick = self._next_tick()
+            if tick is None or tick >= limit:
+                self.clock.ticks = max(self.clock.ticks, limit)
+                break
+            self.step()
+        return self.clock.now
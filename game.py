@@ -1,137 +1,97 @@
-import random
-import time
-
-from player_board import PlayerBoard
-from unit import Phoenix, Lion, Salamander, Dragon, Scorpion, Dummy
-
-class Game:
-    def __init__(self, screen_width, screen_height):
-        self.board = PlayerBoard(screen_width, screen_height)
-        # Update projectiles and remove those that hit the target
-        self.projectile = []
-
-        # Fire Character Pool
-        self.fire_character_pool = [
-            Phoenix(), Lion(), Salamander(), Dragon(), Scorpion()
-        ]
-
-        # Generate Target Dummy and a random Fire unit
-        self.units = [Dragon()]  # Always include the Target Dummy
-        self.units.append(Phoenix())  # Add a random Fire unit
-
-        # Place the Target Dummy and Fire unit
-        self.place_units()
-
-        # Timer for controlling movement and attack frequency
-        self.game_start_time = time.time()
-        self.last_action_time = self.game_start_time
-        self.action_interval = 1.5  # Start with 1.5-second delay
-
-    def place_units(self):
-        """Place the Target Dummy at the top and the Fire unit at the bottom."""
-        # Target Dummy at the top center
-        self.board.place_unit(self.units[0], x=self.board.grid_width // 2, y=0)
-
-        # Fire unit at the bottom center
-        self.board.place_unit(self.units[1], x=self.board.grid_width // 2, y=self.board.grid_height - 1)
-
-    def calculate_distance(self, unit, target):
-        """Calculate Manhattan distance between two units (diagonal counts as 2 units)."""
-        dx = abs(unit.x - target.x)
-        dy = abs(unit.y - target.y)
-        return dx + dy if dx == 0 or dy == 0 else dx + dy + 1
-
-    def find_nearest_target(self, unit):
-        """Find the nearest enemy unit for a given unit."""
-        nearest_target = None
-        min_distance = float('inf')
-        for target in self.units:
-            if target != unit and target.health > 0:
-                distance = self.calculate_distance(unit, target)
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_target = target
-        return nearest_target
-
-    def execute_movement(self):
-        """Move each unit according to its range and proximity to nearest enemy."""
-        for unit in self.units:
-            if unit.health <= 0:
-                continue  # Skip dead units
-
-            # Check if there is any target in range
-            in_combat = False
-            for target in self.units:
-                if target != unit and target.health > 0 and unit.can_attack(target):
-                    in_combat = True
-                    break
-
-            # Move towards the nearest target if not in combat
-            if not in_combat:
-                target = self.find_nearest_target(unit)
-                if target:
-                    dx = target.x - unit.x
-                    dy = target.y - unit.y
-                    new_x = unit.x + (1 if dx > 0 else -1 if dx < 0 else 0)
-                    new_y = unit.y + (1 if dy > 0 else -1 if dy < 0 else 0)
-
-                    # Place the unit at the new position
-                    self.board.place_unit(unit, new_x, new_y)
-
-    def start_combat(self):
-        """Combat loop: Units attempt to attack if in range."""
-        for unit in self.units:
-            if unit.health <= 0:
-                continue  # Skip defeated units
-
-            # Normal attack on enemies
-            for target in self.units:
-                if target != unit and target.health > 0 and unit.can_attack(target):
-                    projectile = unit.attack_enemy(
-                        target,
-                        cell_size=self.board.cell_size,
-                        offset_x=self.board.offset_x,
-                        offset_y=self.board.offset_y
-                    )
-
-                    if projectile:  # If a projectile was created
-                        self.projectile.append(projectile)  # Add it to the game’s projectile list
-
-                    if target.health <= 0:  # Handle target death
-                        print(f"{target.name} has been defeated!")
-                        self.handle_unit_death(target)
-
-    def handle_unit_death(self, unit):
-        """Remove a defeated unit from the grid and update its position to None."""
-        if unit.health <= 0:
-            print(f"{unit.name} has been defeated!")
-            # Clear the grid position for the defeated unit
-            self.board.grid[unit.y][unit.x] = None
-            # Remove the unit from the units list
-            self.units.remove(unit)
-
-    def update(self):
-        """Update game state."""
-        current_time = time.time()
-
-        # Initial pause logic
-        if current_time - self.game_start_time < 1.5:
-            return  # Pause for the first 1.5 seconds
-
-        if self.action_interval != 0.75:
-            self.action_interval = 0.75  # Update interval after the initial pause
-
-        self.execute_movement()
-        self.start_combat()
-        self.last_action_time = current_time  # Reset timer
-
-        # Update and remove projectiles that hit their target
-        for projectile in list(self.projectile):  # Use a copy of the list to modify safely
-            if projectile.update():  # If projectile hits the target
-                self.projectile.remove(projectile)
-
-    def draw(self, screen):
-        screen.fill((0, 0, 0))  # Clear the screen
-        self.board.draw(screen)  # Draw the board, units, and bars
-        for projectile in self.projectile:
-            projectile.draw(screen)
+import time
+
+import assets
+from combat_log import CombatLog, ConsoleWriter, DEBUG
+from player_board import PlayerBoard
+from profiling import PhaseProfiler, NULL_PROFILER
+from Projectile import PROJECTILE_SIZE, CLOSE_PROJECTILE_IMAGE, RANGED_PROJECTILE_IMAGE
+from renderer import RENDERERS
+from replay import ReplayRecorder
+from simulation import Simulation
+from sprite_atlas import SpriteAtlas
+from unit import Phoenix, Lion, Salamander, Dragon, Scorpion, Dummy, UNIT_IMAGE_SIZE
+
+try:
+    from projectile_batch import ProjectileBatch
+except ImportError:  # NumPy is optional; projectiles then update one at a time
+    ProjectileBatch = None
+
+class Game:
+    def __init__(self, screen_width, screen_height, speed=1.0, render_mode="dirty", record_path=None, profile=False):
+        self.board = PlayerBoard(screen_width, screen_height)
+        # All combat state lives in the simulation; the game only paces and draws it
+        self.combat_log = CombatLog(level=DEBUG, writers=[ConsoleWriter()])
+        self.simulation = Simulation(self.board, log=self.combat_log,
+                                     projectiles=ProjectileBatch() if ProjectileBatch is not None else None)
+
+        # Fire Character Pool
+        self.fire_character_pool = [
+            Phoenix(), Lion(), Salamander(), Dragon(), Scorpion()
+        ]
+
+        # Place the Target Dummy and Fire unit
+        self.place_units()
+        self.warm_up_assets()
+
+        # Optionally record the match as a binary replay (see replay.py)
+        self.recorder = ReplayRecorder(record_path, self.simulation) if record_path else None
+
+        # "dirty" pushes only changed cells, bars and projectiles; "full" repaints every frame
+        self.renderer = RENDERERS[render_mode]()
+
+        # Optional per-phase timings (see profiling.py); display.update is timed by the caller
+        self.profiler = PhaseProfiler() if profile else NULL_PROFILER
+        if profile:
+            self.profiler.instrument_simulation(self.simulation)
+            self.renderer.profiler = self.profiler  # Times board drawing, whichever calls the renderer makes
+            self.profiler.instrument(self.board, "draw_unit", "draw_unit")
+            self.profiler.instrument(self.renderer, "draw", "render")
+
+        # Real time drives the simulation clock; speed > 1 fast-forwards the match
+        self.speed = speed
+        self.last_update_time = time.time()
+
+    @property
+    def units(self):
+        return self.simulation.units
+
+    @property
+    def projectile(self):
+        return self.simulation.projectiles
+
+    def place_units(self):
+        """Place the Target Dummy at the top and the Fire unit at the bottom."""
+        # Target Dummy at the top center
+        self.simulation.add_unit(Dragon(), x=self.board.grid_width // 2, y=0, team=0)
+
+        # Fire unit at the bottom center
+        self.simulation.add_unit(Phoenix(), x=self.board.grid_width // 2, y=self.board.grid_height - 1, team=1)
+
+    def warm_up_assets(self):
+        """Load every sprite the match can show up front so spawns and attacks never hit the disk."""
+        atlas = SpriteAtlas.load()  # One file instead of one per sprite, if it has been built
+        if atlas is not None:
+            assets.use_atlas(atlas)
+        assets.preload([(self.board.background_path, (self.board.screen_width, self.board.screen_height))])
+        assets.preload((unit.image_path, UNIT_IMAGE_SIZE, unit.sprite_key)
+                       for unit in list(self.units) + self.fire_character_pool)
+        assets.preload((path, PROJECTILE_SIZE) for path in (CLOSE_PROJECTILE_IMAGE, RANGED_PROJECTILE_IMAGE))
+
+    def update(self):
+        """Advance the simulation by however many fixed ticks fit in the real time since the last frame."""
+        current_time = time.time()
+        elapsed = (current_time - self.last_update_time) * self.speed
+        self.last_update_time = current_time
+
+        for _ in range(self.simulation.clock.advance(elapsed)):
+            self.simulation.step()
+
+    def close(self):
+        """Finish any replay being recorded."""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def draw(self, screen):
+        """Draw the frame and return the screen rects that changed, for pygame.display.update."""
+        return self.renderer.draw(screen, self.board, self.simulation.projectiles)
@@ -1,48 +1,64 @@
-# main.py
-
-import pygame
-from game import Game
-
-def main():
-    # Initialize Pygame and set to full-screen mode
-    pygame.init()
-    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)  # Full-screen mode
-    screen_width, screen_height = screen.get_size()
-    pygame.display.set_caption("Beastfight Fanatics")
-
-    # Initialize Game
-    game = Game(screen_width, screen_height)
-
-    # Game Loop
-    clock = pygame.time.Clock()
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                # Check if the exit button was clicked
-                if exit_button.collidepoint(event.pos):
-                    running = False
-
-        # Update game (includes both movement and combat)
-        game.update()
-
-        # Draw game state
-        game.draw(screen)
-
-        # Draw the exit button
-        exit_button = pygame.Rect(screen_width - 100, 10, 90, 40)
-        pygame.draw.rect(screen, (255, 206, 27), exit_button)  # Golden color
-        font = pygame.font.Font(None, 36)
-        text = font.render("EXIT", True, (255, 255, 255))  # White text
-        screen.blit(text, (screen_width - 85, 15))
-
-        # Update display
-        pygame.display.flip()
-        clock.tick(30)
-
-    pygame.quit()
-
-if __name__ == "__main__":
-    main()
+# main.py
+
+import sys
+
+import pygame
+from game import Game
+
+def main():
+    # Initialize Pygame and set to full-screen mode
+    pygame.init()
+    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)  # Full-screen mode
+    screen_width, screen_height = screen.get_size()
+    pygame.display.set_caption("Beastfight Fanatics")
+
+    # Initialize Game ("python main.py --full-redraw" repaints the whole screen every frame)
+    # "python main.py --record match.bfr" saves a binary replay of the match
+    # "python main.py --profile" shows rolling per-phase frame timings
+    render_mode = "full" if "--full-redraw" in sys.argv else "dirty"
+    record_path = sys.argv[sys.argv.index("--record") + 1] if "--record" in sys.argv else None
+    game = Game(screen_width, screen_height, render_mode=render_mode, record_path=record_path,
+                profile="--profile" in sys.argv)
+    profiler_font = pygame.font.Font(None, 24)
+
+    # Game Loop
+    clock = pygame.time.Clock()
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                # Check if the exit button was clicked
+                if exit_button.collidepoint(event.pos):
+                    running = False
+
+        # Update game (includes both movement and combat)
+        game.update()
+
+        # Draw game state
+        dirty_rects = game.draw(screen)
+
+        # Draw the exit button
+        exit_button = pygame.Rect(screen_width - 100, 10, 90, 40)
+        pygame.draw.rect(screen, (255, 206, 27), exit_button)  # Golden color
+        font = pygame.font.Font(None, 36)
+        text = font.render("EXIT", True, (255, 255, 255))  # White text
+        screen.blit(text, (screen_width - 85, 15))
+
+        # Profiler overlay, when enabled
+        overlay = game.profiler.draw_overlay(screen, profiler_font)
+        if overlay is not None:
+            dirty_rects.append(overlay)
+
+        # Update only the parts of the display that changed
+        with game.profiler.phase("display"):
+            pygame.display.update(dirty_rects)
+        game.profiler.end_frame()
+        clock.tick(30)
+
+    game.close()
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# matchup.py
+#
+# Monte Carlo balance runner: plays many seeded headless fights between two
+# lineups across a process pool and summarises the outcome.
+#
+#     python matchup.py Dragon,Phoenix Lion,Salamander -n 2000
+
+import argparse
+import importlib
+import math
+import multiprocessing
+import os
+import statistics
+
+import unit as unit_module
+
+Z_95 = 1.96  # Normal quantile for 95% confidence intervals
+
+
+ENGINES = {
+    "object": "simulation.Simulation",
+    "array": "array_simulation.ArraySimulation",
+    "event": "event_simulation.EventSimulation",
+}
+
+
+def load_engine(name):
+    """Import an engine class lazily so the object engine never needs NumPy."""
+    module_name, class_name = ENGINES[name].rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def play_fight(lineup_a, lineup_b, seed, max_time=120.0, engine="object"):
+    """Play one headless fight. Returns (winner, duration, surviving_hp_a, surviving_hp_b)."""
+    simulation = load_engine(engine)(seed=seed)
+    simulation.add_lineup([unit_class() for unit_class in lineup_a], team=0, y=0)
+    simulation.add_lineup([unit_class() for unit_class in lineup_b], team=1, y=simulation.board.grid_height - 1)
+    duration = simulation.run(max_time)
+
+    surviving_hp = [0.0, 0.0]
+    for unit in simulation.units:
+        if unit.health > 0:
+            surviving_hp[unit.team] += unit.health
+    return simulation.winner(), duration, surviving_hp[0], surviving_hp[1]
+
+
+def _play_fight_job(args):
+    return play_fight(*args)
+
+
+def mean_ci(values):
+    """Mean and 95% normal-approximation confidence interval of a sample."""
+    if not values:
+        return float("nan"), (float("nan"), float("nan"))
+    mean = statistics.fmean(values)
+    if len(values) < 2:
+        return mean, (mean, mean)
+    half_width = Z_95 * statistics.stdev(values) / math.sqrt(len(values))
+    return mean, (mean - half_width, mean + half_width)
+
+
+def wilson_ci(successes, trials):
+    """95% Wilson score interval for a binomial proportion."""
+    if trials == 0:
+        return float("nan"), float("nan")
+    p = successes / trials
+    denominator = 1 + Z_95 ** 2 / trials
+    centre = (p + Z_95 ** 2 / (2 * trials)) / denominator
+    half_width = Z_95 * math.sqrt(p * (1 - p) / trials + Z_95 ** 2 / (4 * trials ** 2)) / denominator
+    return centre - half_width, centre + half_width
+
+
+class MatchupResult:
+    """Summary statistics for a batch of fights between lineup A (team 0) and lineup B (team 1)."""
+
+    def __init__(self, outcomes):
+        self.fights = len(outcomes)
+        self.wins_a = sum(1 for winner, _, _, _ in outcomes if winner == 0)
+        self.wins_b = sum(1 for winner, _, _, _ in outcomes if winner == 1)
+        self.draws = self.fights - self.wins_a - self.wins_b
+
+        self.win_rate = self.wins_a / self.fights if self.fights else float("nan")
+        self.win_rate_ci = wilson_ci(self.wins_a, self.fights)
+
+        # Time-to-kill only counts fights that ended with a winner
+        self.mean_time_to_kill, self.time_to_kill_ci = mean_ci(
+            [duration for winner, duration, _, _ in outcomes if winner is not None])
+        self.mean_surviving_hp_a, self.surviving_hp_a_ci = mean_ci([hp_a for _, _, hp_a, _ in outcomes])
+        self.mean_surviving_hp_b, self.surviving_hp_b_ci = mean_ci([hp_b for _, _, _, hp_b in outcomes])
+
+    def __str__(self):
+        return (
+            f"fights: {self.fights} (A {self.wins_a} / B {self.wins_b} / draw {self.draws})\n"
+            f"A win rate: {self.win_rate:.3f} [{self.win_rate_ci[0]:.3f}, {self.win_rate_ci[1]:.3f}]\n"
+            f"time to kill: {self.mean_time_to_kill:.2f}s "
+            f"[{self.time_to_kill_ci[0]:.2f}, {self.time_to_kill_ci[1]:.2f}]\n"
+            f"surviving HP A: {self.mean_surviving_hp_a:.1f} "
+            f"[{self.surviving_hp_a_ci[0]:.1f}, {self.surviving_hp_a_ci[1]:.1f}]\n"
+            f"surviving HP B: {self.mean_surviving_hp_b:.1f} "
+            f"[{self.surviving_hp_b_ci[0]:.1f}, {self.surviving_hp_b_ci[1]:.1f}]"
+        )
+
+
+def run_matchup(lineup_a, lineup_b, fights=1000, seed=0, processes=None, max_time=120.0, engine="object"):
+    """Play `fights` seeded fights of lineup_a vs lineup_b (lists of Unit classes) on all cores."""
+    jobs = [(lineup_a, lineup_b, seed + i, max_time, engine) for i in range(fights)]
+    processes = processes or os.cpu_count() or 1
+    chunksize = max(1, fights // (processes * 4))
+    with multiprocessing.Pool(processes) as pool:
+        outcomes = pool.map(_play_fight_job, jobs, chunksize)
+    return MatchupResult(outcomes)
+
+
+def parse_lineup(text):
+    """Turn 'Dragon,Phoenix' into [Dragon, Phoenix] unit classes."""
+    return [getattr(unit_module, name.strip()) for name in text.split(",") if name.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play many seeded headless fights between two lineups.")
+    parser.add_argument("lineup_a", help="comma-separated unit classes, e.g. Dragon,Phoenix")
+    parser.add_argument("lineup_b", help="comma-separated unit classes, e.g. Lion,Salamander")
+    parser.add_argument("-n", "--fights", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-j", "--processes", type=int, default=None)
+    parser.add_argument("--max-time", type=float, default=120.0, help="simulated seconds before a fight is a draw")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="object",
+                        help="object: Simulation; array: NumPy ArraySimulation, faster but its movers step "
+                             "straight at their target instead of pathing around blockers, so single fights "
+                             "and close matchups can come out differently; event: EventSimulation")
+    args = parser.parse_args()
+
+    result = run_matchup(parse_lineup(args.lineup_a), parse_lineup(args.lineup_b), args.fights,
+                         args.seed, args.processes, args.max_time, args.engine)
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
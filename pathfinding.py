@@ -0,0 +1,141 @@
+# pathfinding.py
+#
+# Flow fields for unit movement. Instead of every unit searching for its own target,
+# each team gets one distance field per movement step: a Dijkstra pass outward from
+# every enemy-held cell, stopping once every unit on the side has its distance. A unit
+# then just steps to the free neighbouring cell with the lowest distance, which walks
+# it around anything in the way. When a side has few units and few enemies for the board
+# size (a sparse large board), flooding the field costs far more than measuring each
+# enemy, so the side steps directly instead.
+
+# Cells held by allies can be passed through once they move, so they cost extra rather than blocking
+FRIENDLY_COST = 4
+# Movement directions in tie-break order: straight steps first, then diagonals
+NEIGHBOURS = ((0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1))
+UNREACHABLE = 1 << 30
+
+
+def neighbours(cell, width, height):
+    """The on-board neighbours of a cell number (y * width + x), in NEIGHBOURS order."""
+    x, y = cell % width, cell // width
+    return [cell + dy * width + dx for dx, dy in NEIGHBOURS if 0 <= x + dx < width and 0 <= y + dy < height]
+
+
+class FlowField:
+    """Distance from cells to the nearest enemy for one side of the fight.
+
+    Costs are small integers, so the search keeps one bucket per distance instead of a
+    heap. It stops as soon as the cells around every unit on the side are final; cells
+    further out may be left unexplored.
+    """
+
+    def __init__(self, board, enemies, units):
+        self.board = board
+        width, height = board.grid_width, board.grid_height
+        cells = board.cells
+        # Flooding is only chosen when the sides are dense for the board, so a flat list costs
+        # no more than the flood itself
+        distance = [UNREACHABLE] * (width * height)
+        # Cell-number offsets to the neighbours of a cell off the board's edge
+        deltas = tuple(dy * width + dx for dx, dy in NEIGHBOURS)
+
+        # Cells whose distance next_step() will read: where the units stand and around them
+        needed = set()
+        for unit in units:
+            cell = unit.y * width + unit.x
+            needed.add(cell)
+            needed.update(neighbours(cell, width, height))
+
+        buckets = [[]]
+        for cell in enemies:
+            distance[cell] = 0
+            buckets[0].append(cell)
+
+        cost = 0
+        while cost < len(buckets) and needed:
+            for cell in buckets[cost]:
+                if distance[cell] != cost:
+                    continue  # Reached more cheaply since it was queued
+                needed.discard(cell)
+                # Stepping from a neighbour into this cell: enemies and empty cells cost one move
+                step = cost + (FRIENDLY_COST if cost and cell in cells else 1)
+                while len(buckets) <= step:
+                    buckets.append([])
+                bucket = buckets[step]
+                x, y = cell % width, cell // width
+                if 0 < x < width - 1 and 0 < y < height - 1:
+                    around = [cell + delta for delta in deltas]
+                else:
+                    around = neighbours(cell, width, height)
+                for neighbour in around:
+                    if step < distance[neighbour]:
+                        distance[neighbour] = step
+                        bucket.append(neighbour)
+            cost += 1
+        self.distance = distance
+
+    def next_step(self, unit):
+        """The free neighbouring cell that gets the unit closest to an enemy, or None to stay put."""
+        width = self.board.grid_width
+        cells = self.board.cells
+        distance = self.distance
+        cell = unit.y * width + unit.x
+        best, step = distance[cell], None
+        for neighbour in neighbours(cell, width, self.board.grid_height):
+            if distance[neighbour] < best and neighbour not in cells:
+                best, step = distance[neighbour], neighbour
+        return None if step is None else (step % width, step // width)
+
+
+class DirectSteps:
+    """next_step() for a sparse side: the free neighbouring cell closest to any enemy.
+
+    Distances are counted in moves (a diagonal is one move), which is what a FlowField
+    measures on open ground, so on an empty board both pick the same step.
+    """
+
+    def __init__(self, board, enemies):
+        self.board = board
+        width = board.grid_width
+        self.enemies = [(cell % width, cell // width) for cell in enemies]
+
+    def _distance(self, x, y):
+        return min(max(abs(x - ex), abs(y - ey)) for ex, ey in self.enemies)
+
+    def next_step(self, unit):
+        if not self.enemies:
+            return None
+        cells, width, height = self.board.cells, self.board.grid_width, self.board.grid_height
+        best, step = self._distance(unit.x, unit.y), None
+        for dx, dy in NEIGHBOURS:  # Only the eight cells around the unit, worked out as needed
+            x, y = unit.x + dx, unit.y + dy
+            if 0 <= x < width and 0 <= y < height and y * width + x not in cells:
+                distance = self._distance(x, y)
+                if distance < best:
+                    best, step = distance, (x, y)
+        return step
+
+
+class FlowFields:
+    """The fields for one movement step, built the first time a unit of each side asks."""
+
+    def __init__(self, board):
+        self.board = board
+        self._fields = {}
+
+    def next_step(self, unit):
+        # Units without a team fight everyone, so each gets a field of its own
+        key = unit.team if unit.team is not None else id(unit)
+        field = self._fields.get(key)
+        if field is None:
+            board = self.board
+            enemies = list(board.enemy_cells(unit))
+            side_size = 1 if unit.team is None else len(board.team_cells.get(unit.team, ()))
+            if side_size * len(enemies) * len(NEIGHBOURS) <= board.grid_width * board.grid_height:
+                field = DirectSteps(board, enemies)  # Cheaper than flooding the board
+            else:
+                side = [unit] if unit.team is None else [other for other in board.cells.values()
+                                                         if other.team == unit.team]
+                field = FlowField(board, enemies, side)
+            self._fields[key] = field
+        return field.next_step(unit)
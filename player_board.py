@@ -1,127 +1,419 @@
-import pygame
-
-class PlayerBoard:
-    def __init__(self, screen_width, screen_height):
-        self.grid_width = 12
-        self.grid_height = 4
-        self.cell_size = min(screen_width // self.grid_width, screen_height // 8)
-        self.grid = [[None for _ in range(self.grid_width)] for _ in range(self.grid_height)]
-
-        # Calculate offsets to center the grid horizontally and position it at the bottom
-        self.offset_x = (screen_width - (self.grid_width * self.cell_size)) // 2
-        self.offset_y = screen_height - (self.grid_height * self.cell_size) - 50
-
-        # Load the background image
-        try:
-            self.background = pygame.image.load("Fire Characters/background.png")
-            self.background = pygame.transform.scale(self.background, (screen_width, screen_height))
-        except pygame.error as e:
-            print(f"Could not load background image: {e}")
-            self.background = None
-
-    def place_unit(self, unit, x, y):
-        """Place a unit at a specific grid position. If occupied, find the next closest empty space."""
-        while y < self.grid_height and self.grid[y][x] is not None:
-            y += 1  # Move downward
-            if y >= self.grid_height:
-                y = 0  # Wrap around to the top
-                x = (x + 1) % self.grid_width  # Move to the next column
-
-        # Place the unit in the found position
-        if self.grid[y][x] is None:
-            # Clear previous position
-            if 0 <= unit.y < self.grid_height and 0 <= unit.x < self.grid_width:
-                self.grid[unit.y][unit.x] = None
-
-            # Update unit's position
-            unit.x, unit.y = x, y
-            self.grid[y][x] = unit
-            return True
-        return False
-
-    def draw(self, screen):
-        """Draw the background, grid, units, health bars, and resource bars."""
-        # Draw background
-        if self.background:
-            screen.blit(self.background, (0, 0))
-        else:
-            screen.fill((0, 0, 0))
-
-        # Draw grid lines
-        for x in range(self.grid_width):
-            for y in range(self.grid_height):
-                rect = pygame.Rect(
-                    self.offset_x + x * self.cell_size,
-                    self.offset_y + y * self.cell_size,
-                    self.cell_size,
-                    self.cell_size
-                )
-                pygame.draw.rect(screen, (255, 255, 255), rect, 1)
-
-        # Draw each unit and its bars
-        for y, row in enumerate(self.grid):
-            for x, unit in enumerate(row):
-                if unit and unit.image:
-                    self.draw_unit(screen, unit, x, y)
-
-    def draw_unit(self, screen, unit, grid_x, grid_y):
-        """Draw a unit, its health bar, and its resource bar."""
-        # Position calculations
-        unit_x = self.offset_x + grid_x * self.cell_size + (self.cell_size - unit.image.get_width()) // 2
-        unit_y = self.offset_y + grid_y * self.cell_size + (self.cell_size - unit.image.get_height()) // 2
-        screen.blit(unit.image, (unit_x, unit_y))
-
-        # Health bar
-        health_bar_width = int(self.cell_size * 0.9)
-        health_bar_height = 8
-        health_ratio = unit.health / unit.max_health
-        health_bar_x = unit_x + (self.cell_size - health_bar_width) // 2
-        health_bar_y = unit_y - 12  # Position above the unit image
-
-        # Draw health bar
-        self.draw_bar(
-            screen,
-            health_bar_x,
-            health_bar_y,
-            health_bar_width,
-            health_bar_height,
-            health_ratio,
-            (255, 0, 0),  # Background color (red)
-            (255, 206, 27)  # Fill color (mustard yellow)
-        )
-
-        # Resource bar
-        magic_bar_height = 6
-        magic_bar_x = health_bar_x
-        magic_bar_y = health_bar_y + health_bar_height + 2
-
-        # Determine resource bar colors
-        if unit.hasMana:
-            magic_ratio = unit.current_mana / unit.mana_pool
-            magic_bar_color = (0, 0, 128)  # Dark blue for mana
-            magic_fill_color = (0, 0, 255)  # Bright blue for filled mana
-        else:
-            magic_ratio = unit.current_mana / unit.mana_pool
-            magic_bar_color = (128, 0, 0)  # Dark red for rage
-            magic_fill_color = (255, 0, 0)  # Bright red for filled rage
-
-        # Draw resource bar
-        self.draw_bar(
-            screen,
-            magic_bar_x,
-            magic_bar_y,
-            health_bar_width,
-            magic_bar_height,
-            magic_ratio,
-            magic_bar_color,
-            magic_fill_color
-        )
-
-    @staticmethod
-    def draw_bar(screen, x, y, width, height, ratio, bg_color, fill_color):
-        """Draw a bar (health, mana, rage, etc.) with the specified parameters."""
-        # Background bar
-        pygame.draw.rect(screen, bg_color, (x, y, width, height))
-        # Filled portion
-        filled_width = int(width * ratio)  # Calculate the width of the filled portion
-        pygame.draw.rect(screen, fill_color, (x, y, filled_width, height))
+import pygame
+
+from assets import load_image
+from attack_range import range_masks
+
+
+def ring_offsets(distance):
+    """All (dx, dy) offsets at exactly this movement distance (a diagonal step costs one extra)."""
+    offsets = [(0, distance), (0, -distance), (distance, 0), (-distance, 0)]
+    for adx in range(1, distance - 1):
+        ady = distance - adx - 1
+        offsets.extend([(adx, ady), (-adx, ady), (adx, -ady), (-adx, -ady)])
+    return offsets
+
+
+def ring_rank(dx, dy):
+    """Position of a non-zero offset within its ring_offsets() list, for tie-breaks."""
+    if not dx:
+        return 0 if dy > 0 else 1
+    if not dy:
+        return 2 if dx > 0 else 3
+    return 4 * abs(dx) + (dx < 0) + 2 * (dy < 0)
+
+
+class PlayerBoard:
+    def __init__(self, screen_width, screen_height, grid_width=12, grid_height=4):
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        # The spatial index: cell number (y * grid_width + x) -> the unit standing there.
+        # Only occupied cells are stored, so memory and drawing scale with units, not board size
+        self.cells = {}
+        self.range_masks = range_masks(self.grid_width, self.grid_height)
+        # Cell numbers held by each team, so enemy queries only look at the other teams' units,
+        # and the same per row: team -> row -> bitset of the team's columns (empty rows left out),
+        # with team -> bitset of the rows the team is on
+        self.team_cells = {}
+        self.team_rows = {}
+        self.team_row_bits = {}
+        # Free-cell index: row -> bitset of its occupied columns (empty rows left out), plus a
+        # bitset of the rows with no free cell, so free_cell() skips full rows a word at a time
+        self.row_bits = {}
+        self.full_rows = 0
+        self._full_row = (1 << self.grid_width) - 1
+        self.max_distance = self.grid_width + self.grid_height - 1  # Farthest two cells can be apart
+        self._rings = [[]]  # Ring offsets by distance, extended as searches reach further out
+
+        # The background image is loaded on the first draw so a headless board does no asset I/O
+        self.background_path = "Fire Characters/background.png"
+        self._static_layer = None  # Background and grid lines, pre-rendered on the first draw
+        self.resize(screen_width, screen_height)
+
+    def resize(self, screen_width, screen_height):
+        """Lay the grid out for a screen size; the cached static layer is rebuilt on the next draw."""
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        # The standard 4-row board takes the bottom half of the screen; taller boards shrink their cells to fit
+        self.cell_size = min(screen_width // self.grid_width, screen_height // max(8, self.grid_height + 2))
+
+        # Calculate offsets to center the grid horizontally and position it at the bottom
+        self.offset_x = (screen_width - (self.grid_width * self.cell_size)) // 2
+        self.offset_y = screen_height - (self.grid_height * self.cell_size) - 50
+        self._static_layer = None
+
+    @property
+    def background(self):
+        """The background image scaled to the screen, from the shared asset cache."""
+        return load_image(self.background_path, (self.screen_width, self.screen_height))
+
+    @property
+    def grid(self):
+        """Dense rows-of-cells snapshot of the board, built on demand (O(width * height))."""
+        return [[self.cells.get(y * self.grid_width + x) for x in range(self.grid_width)]
+                for y in range(self.grid_height)]
+
+    def free_cell(self, x, y):
+        """The empty cell nearest to (x, y), ties going to whichever comes first in ring order, or None
+        if the board is full. Rows are visited nearest first and full rows skipped; each open row
+        offers only its closest free column on either side of x."""
+        width, height = self.grid_width, self.grid_height
+        if len(self.cells) >= width * height:
+            return None
+        if y * width + x not in self.cells:
+            return x, y
+        best, best_key = None, None
+        below, above = self._open_row(y, 1), self._open_row(y - 1, -1)
+        while below is not None or above is not None:
+            if above is None or (below is not None and below - y <= y - above):
+                row, below = below, self._open_row(below + 1, 1)
+            else:
+                row, above = above, self._open_row(above - 1, -1)
+            dy = row - y
+            if best_key is not None and abs(dy) > best_key[0]:
+                break  # Every cell from here on is farther than the best found
+            for cx in self._free_columns(row, x):
+                dx = cx - x
+                distance = abs(dx) + abs(dy) + (1 if dx and dy else 0)
+                key = (distance, ring_rank(dx, dy))
+                if best_key is None or key < best_key:
+                    best, best_key = (cx, row), key
+        return best
+
+    def _open_row(self, y, step):
+        """The first row from y going in step's direction (+1 or -1) with a free cell, or None."""
+        if not 0 <= y < self.grid_height:
+            return None
+        open_rows = ~self.full_rows & ((1 << self.grid_height) - 1)
+        if step > 0:
+            open_rows >>= y
+            return y + (open_rows & -open_rows).bit_length() - 1 if open_rows else None
+        open_rows &= (1 << (y + 1)) - 1
+        return open_rows.bit_length() - 1 if open_rows else None
+
+    def _free_columns(self, y, x):
+        """The free columns of row y closest to x on its left and right (x itself counts as right)."""
+        free = ~self.row_bits.get(y, 0) & self._full_row
+        right = free >> x
+        if right:
+            yield x + (right & -right).bit_length() - 1
+        left = free & ((1 << x) - 1)
+        if left:
+            yield left.bit_length() - 1
+
+    def place_unit(self, unit, x, y):
+        """Place a unit at a specific grid position. If occupied, find the next closest empty space."""
+        if not (0 <= x < self.grid_width and 0 <= y < self.grid_height):
+            # Requests off the board start from the nearest edge cell
+            x = min(max(x, 0), self.grid_width - 1)
+            y = min(max(y, 0), self.grid_height - 1)
+        cell = (x, y)
+        if y * self.grid_width + x in self.cells:
+            cell = self.free_cell(x, y)
+            if cell is None:
+                return False
+
+        # Clear previous position (only if the unit is actually there, e.g. not before its first placement)
+        if self.unit_at(unit.x, unit.y) is unit:
+            del self.cells[unit.y * self.grid_width + unit.x]
+            self._unindex(unit)
+
+        # Update unit's position
+        unit.x, unit.y = cell
+        self.cells[unit.y * self.grid_width + unit.x] = unit
+        self._index(unit)
+        return True
+
+    def remove_unit(self, unit):
+        """Clear a unit's cell, e.g. after it has been defeated."""
+        if self.unit_at(unit.x, unit.y) is unit:
+            del self.cells[unit.y * self.grid_width + unit.x]
+            self._unindex(unit)
+
+    def reset_units(self, units):
+        """Replace the whole board with these units at their current positions (off-board ones are skipped)."""
+        self.cells = {}
+        for unit in units:
+            if 0 <= unit.x < self.grid_width and 0 <= unit.y < self.grid_height:
+                self.cells[unit.y * self.grid_width + unit.x] = unit
+        self.rebuild_index()
+
+    def _index(self, unit):
+        self.team_cells.setdefault(unit.team, set()).add(unit.y * self.grid_width + unit.x)
+        team_rows = self.team_rows.setdefault(unit.team, {})
+        team_rows[unit.y] = team_rows.get(unit.y, 0) | 1 << unit.x
+        self.team_row_bits[unit.team] = self.team_row_bits.get(unit.team, 0) | 1 << unit.y
+        row = self.row_bits[unit.y] = self.row_bits.get(unit.y, 0) | 1 << unit.x
+        if row == self._full_row:
+            self.full_rows |= 1 << unit.y
+
+    def _unindex(self, unit):
+        self.team_cells[unit.team].discard(unit.y * self.grid_width + unit.x)
+        team_rows = self.team_rows[unit.team]
+        team_row = team_rows[unit.y] & ~(1 << unit.x)
+        if team_row:
+            team_rows[unit.y] = team_row
+        else:
+            del team_rows[unit.y]
+            self.team_row_bits[unit.team] &= ~(1 << unit.y)
+        row = self.row_bits[unit.y] & ~(1 << unit.x)
+        if row:
+            self.row_bits[unit.y] = row
+        else:
+            del self.row_bits[unit.y]
+        self.full_rows &= ~(1 << unit.y)
+
+    def rebuild_index(self):
+        """Recompute the per-team and free-cell indexes after the cells were rewritten wholesale."""
+        self.team_cells = {}
+        self.team_rows = {}
+        self.team_row_bits = {}
+        self.row_bits = {}
+        self.full_rows = 0
+        for unit in self.cells.values():
+            self._index(unit)
+
+    def enemy_count(self, unit):
+        """How many units are the unit's enemies (everyone else if it has no team)."""
+        if unit.team is None:
+            return len(self.cells) - 1
+        return len(self.cells) - len(self.team_cells.get(unit.team, ()))
+
+    def enemy_cells(self, unit):
+        """Yield the cell numbers held by the unit's enemies, in no particular order."""
+        own = unit.y * self.grid_width + unit.x
+        for team, cells in self.team_cells.items():
+            if team != unit.team:
+                yield from cells
+            elif team is None:  # Teamless units fight each other
+                yield from (cell for cell in cells if cell != own)
+
+    def unit_at(self, x, y):
+        """The unit standing on a cell, or None for empty or off-board cells."""
+        if 0 <= x < self.grid_width and 0 <= y < self.grid_height:
+            return self.cells.get(y * self.grid_width + x)
+        return None
+
+    def _ring(self, distance):
+        while distance >= len(self._rings):
+            self._rings.append(ring_offsets(len(self._rings)))
+        return self._rings[distance]
+
+    def nearest_enemy(self, unit):
+        """The closest live enemy, ties going to whichever comes first in ring order.
+
+        Crowded boards are searched outward ring by ring from the unit's cell. When the enemies
+        are few for the board size (a mostly empty large board), measuring each one is cheaper.
+        """
+        enemy_count = self.enemy_count(unit)
+        if not enemy_count:
+            return None
+        if enemy_count ** 2 <= self.grid_width * self.grid_height:
+            return self._nearest_of(unit)
+
+        cells, width, height = self.cells, self.grid_width, self.grid_height
+        for distance in range(1, self.max_distance + 1):
+            for dx, dy in self._ring(distance):
+                x, y = unit.x + dx, unit.y + dy
+                if 0 <= x < width and 0 <= y < height:
+                    target = cells.get(y * width + x)
+                    if target is not None and target.health > 0 and unit.is_enemy(target):
+                        return target
+        return None
+
+    def _nearest_of(self, unit):
+        """nearest_enemy by measuring every enemy."""
+        nearest, nearest_key = None, None
+        width = self.grid_width
+        for cell in self.enemy_cells(unit):
+            target = self.cells[cell]
+            if target.health <= 0:
+                continue
+            dx, dy = cell % width - unit.x, cell // width - unit.y
+            distance = abs(dx) + abs(dy) + (1 if dx and dy else 0)
+            key = (distance, ring_rank(dx, dy))
+            if nearest_key is None or key < nearest_key:
+                nearest, nearest_key = target, key
+        return nearest
+
+    def enemies_in_range(self, unit):
+        """Yield live enemies the unit can attack, lowest cell first.
+
+        A unit's reach is a rectangle, so it is read off the enemy teams' row bitsets, visiting
+        only the rows in reach that hold an enemy: at most as many as the range or the enemies.
+        """
+        cells, width, height = self.cells, self.grid_width, self.grid_height
+        x, y = unit.x, unit.y
+        max_dx, max_dy = self.range_masks.bounds[unit.attack_range]
+        left, right = max(x - max_dx, 0), min(x + max_dx, width - 1)
+        top, bottom = max(y - max_dy, 0), min(y + max_dy, height - 1)
+        columns = ((1 << (right - left + 1)) - 1) << left
+        enemy_teams = [team for team in self.team_rows if team != unit.team or team is None]
+        open_rows = 0
+        for team in enemy_teams:
+            open_rows |= self.team_row_bits[team]
+        open_rows &= ((1 << (bottom - top + 1)) - 1) << top  # Rows in reach holding enemies
+        while open_rows:
+            low = open_rows & -open_rows
+            open_rows ^= low
+            row = low.bit_length() - 1
+            bits = 0
+            for team in enemy_teams:
+                bits |= self.team_rows[team].get(row, 0)
+            bits &= columns
+            if row == y:
+                bits &= ~(1 << x)  # A teamless unit is in its own enemies' rows
+            while bits:
+                low = bits & -bits
+                bits ^= low
+                target = cells.get(row * width + low.bit_length() - 1)  # May have died mid-loop
+                if target is not None and target.health > 0:
+                    yield target
+
+    def enemy_in_range(self, unit):
+        """The first live enemy the unit can attack, or None."""
+        return next(self.enemies_in_range(unit), None)
+
+    def static_layer(self, screen):
+        """The background and grid lines, rendered once and reused until the screen size changes."""
+        if screen.get_size() != (self.screen_width, self.screen_height):
+            self.resize(*screen.get_size())
+        if self._static_layer is None:
+            # Match the target's pixel format without needing a display, so off-screen boards draw too
+            layer = pygame.Surface((self.screen_width, self.screen_height), 0, screen)
+
+            # Draw background
+            if self.background:
+                layer.blit(self.background, (0, 0))
+            else:
+                layer.fill((0, 0, 0))
+
+            # Draw grid lines
+            for x in range(self.grid_width):
+                for y in range(self.grid_height):
+                    rect = pygame.Rect(
+                        self.offset_x + x * self.cell_size,
+                        self.offset_y + y * self.cell_size,
+                        self.cell_size,
+                        self.cell_size
+                    )
+                    pygame.draw.rect(layer, (255, 255, 255), rect, 1)
+            self._static_layer = layer
+        return self._static_layer
+
+    def draw(self, screen):
+        """Draw the background, grid, units, health bars, and resource bars. Returns the unit rects drawn."""
+        screen.blit(self.static_layer(screen), (0, 0))
+        return self.draw_units(screen)
+
+    def occupied_cells(self):
+        """Yield (x, y, unit) for every occupied cell in row-major order."""
+        width = self.grid_width
+        for cell in sorted(self.cells):
+            yield cell % width, cell // width, self.cells[cell]
+
+    def draw_units(self, screen):
+        """Draw each unit and its bars on top of whatever is on screen; returns the rects touched."""
+        rects = []
+        for x, y, unit in self.occupied_cells():
+            if unit.image:
+                rects.append(self.draw_unit(screen, unit, x, y))
+        return rects
+
+    def erase(self, screen, rects):
+        """Restore the static layer over rects drawn last frame."""
+        layer = self.static_layer(screen)
+        for rect in rects:
+            screen.blit(layer, rect, rect)
+
+    def draw_unit(self, screen, unit, grid_x, grid_y):
+        """Draw a unit, its health bar, and its resource bar. Returns the screen rect covered."""
+        # Position calculations
+        unit_x = self.offset_x + grid_x * self.cell_size + (self.cell_size - unit.image.get_width()) // 2
+        unit_y = self.offset_y + grid_y * self.cell_size + (self.cell_size - unit.image.get_height()) // 2
+        screen.blit(unit.image, (unit_x, unit_y))
+
+        # Health bar
+        health_bar_width = int(self.cell_size * 0.9)
+        health_bar_height = 8
+        health_ratio = unit.health / unit.max_health
+        health_bar_x = unit_x + (self.cell_size - health_bar_width) // 2
+        health_bar_y = unit_y - 12  # Position above the unit image
+
+        # Draw health bar
+        self.draw_bar(
+            screen,
+            health_bar_x,
+            health_bar_y,
+            health_bar_width,
+            health_bar_height,
+            health_ratio,
+            (255, 0, 0),  # Background color (red)
+            (255, 206, 27)  # Fill color (mustard yellow)
+        )
+
+        # Resource bar
+        magic_bar_height = 6
+        magic_bar_x = health_bar_x
+        magic_bar_y = health_bar_y + health_bar_height + 2
+
+        # Determine resource bar colors
+        if unit.hasMana:
+            magic_ratio = unit.current_mana / unit.mana_pool
+            magic_bar_color = (0, 0, 128)  # Dark blue for mana
+            magic_fill_color = (0, 0, 255)  # Bright blue for filled mana
+        else:
+            magic_ratio = unit.current_mana / unit.mana_pool
+            magic_bar_color = (128, 0, 0)  # Dark red for rage
+            magic_fill_color = (255, 0, 0)  # Bright red for filled rage
+
+        # Draw resource bar
+        self.draw_bar(
+            screen,
+            magic_bar_x,
+            magic_bar_y,
+            health_bar_width,
+            magic_bar_height,
+            magic_ratio,
+            magic_bar_color,
+            magic_fill_color
+        )
+
+        return self.unit_rect(unit, grid_x, grid_y)
+
+    def unit_rect(self, unit, grid_x, grid_y):
+        """Screen rect covered by a unit's image and both bars when drawn on a cell."""
+        image_width, image_height = unit.image.get_size()
+        unit_x = self.offset_x + grid_x * self.cell_size + (self.cell_size - image_width) // 2
+        unit_y = self.offset_y + grid_y * self.cell_size + (self.cell_size - image_height) // 2
+        bar_width = int(self.cell_size * 0.9)
+        bars = pygame.Rect(unit_x + (self.cell_size - bar_width) // 2, unit_y - 12, bar_width, 8 + 2 + 6)
+        return pygame.Rect(unit_x, unit_y, image_width, image_height).union(bars)
+
+    @staticmethod
+    def draw_bar(screen, x, y, width, height, ratio, bg_color, fill_color):
+        """Draw a bar (health, mana, rage, etc.) with the specified parameters."""
+        # Background bar
+        pygame.draw.rect(screen, bg_color, (x, y, width, height))
+        # Filled portion
+        filled_width = int(width * ratio)  # Calculate the width of the filled portion
+        pygame.draw.rect(screen, fill_color, (x, y, filled_width, height))
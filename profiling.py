@@ -0,0 +1,168 @@
+# profiling.py
+#
+# Per-phase timing for the game loop. A PhaseProfiler wraps the methods it is told to
+# watch on a live object, adds up their time per frame and keeps a rolling window of
+# frames so p50/p95/p99 can be read at any moment or drawn as an overlay:
+#
+#     python main.py --profile
+
+import collections
+import math
+import time
+from contextlib import contextmanager, nullcontext
+
+import combat_log
+
+WINDOW = 300  # Frames (and ticks) kept for the rolling percentiles
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(ordered, p):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class PhaseProfiler:
+    """Rolling per-phase frame times and per-tick counts."""
+
+    enabled = True
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self.timings = {}  # phase -> deque of seconds spent per frame
+        self.counts = {}  # counter -> deque of values per tick
+        self._pending = collections.defaultdict(float)  # Time spent so far this frame
+        self._attacks = 0
+
+    def _series(self, table, name):
+        series = table.get(name)
+        if series is None:
+            series = table[name] = collections.deque(maxlen=self.window)
+        return series
+
+    def record(self, name, seconds):
+        """Add time to a phase for the current frame."""
+        self._pending[name] += seconds
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._pending[name] += time.perf_counter() - start
+
+    def instrument(self, obj, method_name, phase_name=None):
+        """Time every call to obj.method_name under a phase by shadowing it on the instance."""
+        method = getattr(obj, method_name)
+        phase_name = phase_name or method_name
+        pending = self._pending
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                pending[phase_name] += perf_counter() - start
+
+        setattr(obj, method_name, timed)
+
+    def instrument_simulation(self, simulation):
+        """Time the simulation phases and count units, projectiles and attacks every tick."""
+        self.instrument(simulation, "execute_movement", "movement")
+        self.instrument(simulation, "start_combat", "combat")
+        self.instrument(simulation, "update_projectiles", "projectiles")
+        step = simulation.step
+
+        def counted_step():
+            start = time.perf_counter()
+            step()
+            self._pending["tick"] += time.perf_counter() - start
+            self.count("units", len(simulation.units))
+            self.count("projectiles", len(simulation.projectiles))
+            self.count("attacks", self._attacks)
+            self._attacks = 0
+
+        simulation.step = counted_step
+        if simulation.log.enabled:
+            simulation.log.add_writer(self)
+
+    def write(self, event):
+        """Combat log writer: count attacks as they happen."""
+        if event.kind == combat_log.ATTACK:
+            self._attacks += 1
+
+    def count(self, name, value):
+        self._series(self.counts, name).append(value)
+
+    def end_frame(self):
+        """Close the current frame: every phase gets one sample, zero if it did not run."""
+        for name in self.timings:
+            self._pending.setdefault(name, 0.0)
+        for name, seconds in self._pending.items():
+            self._series(self.timings, name).append(seconds)
+        self._pending.clear()
+
+    @staticmethod
+    def _summary(series, scale):
+        ordered = sorted(series)
+        summary = {f"p{p}": percentile(ordered, p) * scale for p in PERCENTILES}
+        summary["samples"] = len(ordered)
+        return summary
+
+    def stats(self):
+        """{phase: {"p50", "p95", "p99", "samples"}} of per-frame time in milliseconds."""
+        return {name: self._summary(series, 1000.0) for name, series in self.timings.items()}
+
+    def count_stats(self):
+        """{counter: {"p50", "p95", "p99", "samples"}} of per-tick counts."""
+        return {name: self._summary(series, 1) for name, series in self.counts.items()}
+
+    def report(self):
+        """Text lines for the overlay or a terminal."""
+        lines = ["phase          p50     p95     p99 ms"]
+        for name, summary in sorted(self.stats().items()):
+            lines.append(f"{name:<12}{summary['p50']:7.2f} {summary['p95']:7.2f} {summary['p99']:7.2f}")
+        for name, summary in sorted(self.count_stats().items()):
+            lines.append(f"{name:<12}{summary['p50']:7.0f} {summary['p95']:7.0f} {summary['p99']:7.0f} /tick")
+        return lines
+
+    def draw_overlay(self, screen, font, position=(10, 60)):
+        """Draw the report on an opaque panel and return the rect covered."""
+        surfaces = [font.render(line, True, (255, 255, 255)) for line in self.report()]
+        width = max(surface.get_width() for surface in surfaces) + 12
+        height = sum(surface.get_height() for surface in surfaces) + 12
+        rect = screen.fill((0, 0, 0), (position[0], position[1], width, height))
+        y = position[1] + 6
+        for surface in surfaces:
+            screen.blit(surface, (position[0] + 6, y))
+            y += surface.get_height()
+        return rect
+
+
+class NullProfiler:
+    """Stand-in when profiling is off; costs nothing."""
+
+    enabled = False
+
+    def phase(self, name):
+        return nullcontext()
+
+    def end_frame(self):
+        pass
+
+    def stats(self):
+        return {}
+
+    def count_stats(self):
+        return {}
+
+    def draw_overlay(self, screen, font, position=(10, 60)):
+        return None
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,104 @@
+import numpy as np
+
+from assets import load_image
+from Projectile import PROJECTILE_SIZE
+from unit import UNIT_IMAGE_SIZE
+
+
+class ProjectileBatch:
+    """Homing projectiles as parallel NumPy arrays, all advanced in one vectorised step.
+
+    A drop-in replacement for ProjectilePool (spawn, update, draw, len). Positions, speeds,
+    sprite kinds, board geometry and target ids are columns. Targets are unit ids (unit.uid)
+    into a table of unit cells that the simulation keeps current through track(), so an
+    update is a gather plus array math with no per-projectile Python. The math is exactly
+    Projectile.update's, so a batch moves and hits just like the same projectiles updated
+    one at a time.
+    """
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.geometry = np.zeros((capacity, 3))  # cell_size, offset_x, offset_y
+        self.kind = np.zeros(capacity, dtype=np.intp)  # Index into image_paths
+        self.target = np.zeros(capacity, dtype=np.intp)  # Target's unit id
+        self.unit_cells = np.zeros((16, 2))  # unit id -> (x, y) cell it was last tracked on
+        self.image_paths = []
+        self._kinds = {}  # image path -> kind
+
+    def _grow(self):
+        capacity = 2 * len(self.x)
+        for name in ("x", "y", "speed", "geometry", "kind", "target"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def track(self, unit):
+        """Note the cell a unit stands on; call whenever a unit that can be targeted moves."""
+        if unit.uid >= len(self.unit_cells):
+            cells = np.zeros((max(2 * len(self.unit_cells), unit.uid + 1), 2))
+            cells[:len(self.unit_cells)] = self.unit_cells
+            self.unit_cells = cells
+        self.unit_cells[unit.uid] = unit.x, unit.y
+
+    def spawn(self, image_path, start_x, start_y, target_unit, cell_size, offset_x, offset_y, speed=5):
+        """Launch a projectile at a registered unit; returns its slot, which is only valid until the next update."""
+        if self.count == len(self.x):
+            self._grow()
+        kind = self._kinds.get(image_path)
+        if kind is None:
+            kind = self._kinds[image_path] = len(self.image_paths)
+            self.image_paths.append(image_path)
+        i = self.count
+        self.x[i], self.y[i], self.speed[i] = start_x, start_y, speed
+        self.geometry[i] = cell_size, offset_x, offset_y
+        self.kind[i] = kind
+        self.target[i] = target_unit.uid
+        self.track(target_unit)
+        self.count += 1
+        return i
+
+    def update(self):
+        """Move every projectile toward its target's current cell and drop those that hit."""
+        n = self.count
+        if not n:
+            return
+        cells = self.unit_cells[self.target[:n]]
+        geometry = self.geometry[:n]
+        target_x = cells[:, 0] * geometry[:, 0] + geometry[:, 1] + UNIT_IMAGE_SIZE[0] // 2
+        target_y = cells[:, 1] * geometry[:, 0] + geometry[:, 2] + UNIT_IMAGE_SIZE[1] // 2
+
+        x, y, speed = self.x[:n], self.y[:n], self.speed[:n]
+        dx = target_x - x
+        dy = target_y - y
+        distance = np.maximum(np.sqrt(dx * dx + dy * dy), 1e-5)  # Prevent division by zero
+        x += dx / distance * speed
+        y += dy / distance * speed
+
+        dx = x - target_x
+        dy = y - target_y
+        hit = np.sqrt(dx * dx + dy * dy) < speed
+        if hit.any():
+            keep = ~hit
+            remaining = int(keep.sum())
+            for column in (self.x, self.y, self.speed, self.geometry, self.kind, self.target):
+                column[:remaining] = column[:n][keep]
+            self.count = remaining
+
+    def draw(self, screen):
+        """Draw every live projectile and return the rects covered."""
+        images = [load_image(path, PROJECTILE_SIZE) for path in self.image_paths]
+        n = self.count
+        blits = [(images[kind], (x, y))
+                 for x, y, kind in zip(self.x[:n].tolist(), self.y[:n].tolist(), self.kind[:n].tolist())
+                 if images[kind]]
+        return screen.blits(blits) if blits else []
+
+    def clear(self):
+        self.count = 0
+
+    def __len__(self):
+        return self.count
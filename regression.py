@@ -0,0 +1,132 @@
+# regression.py
+#
+# Headless checks that the optimised paths still agree with their simple reference
+# versions. Run them after touching any of the code they cover:
+#
+#     python regression.py              # every check
+#     python regression.py renderer     # just the named ones
+#
+# Exits with status 1 if any check fails.
+
+import math
+import os
+import random
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Off-screen drawing needs no window
+
+import pygame
+
+import assets
+import unit as unit_module
+from player_board import PlayerBoard
+from renderer import FullRenderer, DirtyRectRenderer
+from replay import ReplayRecorder
+from replay_player import ReplayPlayer
+from simulation import Simulation
+from sprite_atlas import ATLAS_SOURCE_DIRS, SpriteAtlas, build_atlas
+
+# Small enough cells (90 px at 1280x720) that neighbouring 98 px sprites overlap
+RENDER_SCREEN_SIZE = (1280, 720)
+LINEUP_A = ("Dragon", "Phoenix", "Lion", "Salamander", "Scorpion", "Bear")
+LINEUP_B = ("Lion", "Salamander", "Scorpion", "Phoenix", "Dragon", "Wolf")
+
+
+def fight(seed, board=None):
+    """A seeded six-a-side fight on the standard board."""
+    simulation = Simulation(board, seed=seed)
+    simulation.add_lineup([getattr(unit_module, name)() for name in LINEUP_A], team=0, y=0)
+    simulation.add_lineup([getattr(unit_module, name)() for name in LINEUP_B], team=1,
+                          y=simulation.board.grid_height - 1)
+    return simulation
+
+
+def check_renderer(frames=400):
+    """DirtyRectRenderer must leave the screen exactly as a full redraw would, with real sprites."""
+    if not all(os.path.isdir(directory) for directory in ATLAS_SOURCE_DIRS):
+        print("renderer: skipped, the sprite folders are missing")
+        return True
+    with tempfile.TemporaryDirectory() as directory:
+        image_path, index_path = os.path.join(directory, "atlas.png"), os.path.join(directory, "atlas.json")
+        build_atlas(image_path=image_path, index_path=index_path)
+        assets.use_atlas(SpriteAtlas.load(image_path, index_path))
+    try:
+        full_screen, dirty_screen = pygame.Surface(RENDER_SCREEN_SIZE), pygame.Surface(RENDER_SCREEN_SIZE)
+        full, dirty = FullRenderer(), DirtyRectRenderer()
+        differing, seed, simulation = 0, 0, None
+        for _ in range(frames):
+            if simulation is None or simulation.is_finished():
+                simulation = fight(seed, PlayerBoard(*RENDER_SCREEN_SIZE))
+                seed += 1
+                dirty.reset()
+            for _ in range(3):
+                simulation.step()
+            full.draw(full_screen, simulation.board, simulation.projectiles)
+            dirty.draw(dirty_screen, simulation.board, simulation.projectiles)
+            if pygame.image.tobytes(full_screen, "RGB") != pygame.image.tobytes(dirty_screen, "RGB"):
+                differing += 1
+    finally:
+        assets.use_atlas(None)
+    print(f"renderer: {differing} of {frames} frames differ from a full redraw")
+    return differing == 0
+
+
+def unit_state(unit):
+    return unit.team, unit.x, unit.y, unit.health, unit.current_mana
+
+
+def same_state(live, replayed):
+    """Replays store health and mana as 32-bit floats."""
+    return live[:3] == replayed[:3] and all(math.isclose(a, b, rel_tol=1e-6, abs_tol=1e-3)
+                                            for a, b in zip(live[3:], replayed[3:]))
+
+
+def check_replay(seeds=3, keyframe_interval=50):
+    """Seeking a recording to any tick must rebuild exactly the units alive at that tick."""
+    mismatches, positions = 0, 0
+    with tempfile.TemporaryDirectory() as directory:
+        for seed in range(seeds):
+            path = os.path.join(directory, f"fight{seed}.bfr")
+            simulation = fight(seed)
+            recorder = ReplayRecorder(path, simulation, keyframe_interval)
+            live = {simulation.clock.ticks: {unit.uid: unit_state(unit) for unit in simulation.units}}
+            while not simulation.is_finished() and simulation.clock.now < 120.0:
+                simulation.step()
+                live[simulation.clock.ticks] = {unit.uid: unit_state(unit) for unit in simulation.units
+                                                if unit.health > 0}
+            recorder.close()
+
+            player = ReplayPlayer(path, *RENDER_SCREEN_SIZE)
+            ticks = list(live)
+            random.Random(seed).shuffle(ticks)  # Jump around so seeks go backwards and across keyframes
+            for tick in ticks:
+                player.seek(tick)
+                replayed = {uid: unit_state(unit) for uid, unit in player.units.items()}
+                positions += 1
+                if live[tick].keys() != replayed.keys() or not all(
+                        same_state(state, replayed[uid]) for uid, state in live[tick].items()):
+                    mismatches += 1
+            player.close()
+    print(f"replay: {mismatches} of {positions} seek positions differ from the live fight")
+    return mismatches == 0
+
+
+CHECKS = {
+    "renderer": check_renderer,
+    "replay": check_replay,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(CHECKS)
+    pygame.init()
+    failed = [name for name in names if not CHECKS[name]()]
+    pygame.quit()
+    if failed:
+        print(f"failed: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
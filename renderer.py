@@ -0,0 +1,104 @@
+# renderer.py
+#
+# Render modes for the game loop. Both return the screen rects that changed so the
+# caller can hand them to pygame.display.update(). Board drawing is timed as the
+# "board_draw" phase when a profiler is attached (see profiling.py).
+
+from profiling import NULL_PROFILER
+
+class FullRenderer:
+    """Redraw the whole screen every frame."""
+
+    profiler = NULL_PROFILER
+
+    def reset(self):
+        pass
+
+    def draw(self, screen, board, projectiles):
+        with self.profiler.phase("board_draw"):
+            board.draw(screen)
+        projectiles.draw(screen)
+        return [screen.get_rect()]
+
+
+class DirtyRectRenderer:
+    """Redraw only what changed since the last frame.
+
+    Each occupied cell is remembered with a signature of what was drawn there (unit,
+    sprite, health, mana) and the rect it covered. Cells whose signature is unchanged
+    are left alone unless something overlapping them had to be wiped, in which case they are
+    wiped and repainted in row-major order just as a full redraw would stack them.
+    Projectiles move every frame, so their old and new rects are always pushed.
+    """
+
+    profiler = NULL_PROFILER
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget the last frame; the next draw repaints the whole screen."""
+        self._cells = None  # (x, y) -> (signature, rect) as drawn last frame
+        self._projectile_rects = []
+        self._screen_size = None
+
+    @staticmethod
+    def _signature(unit):
+        return id(unit), unit.image, unit.health, unit.current_mana
+
+    def draw(self, screen, board, projectiles):
+        current = {(x, y): unit for x, y, unit in board.occupied_cells() if unit.image}
+
+        if self._cells is None or screen.get_size() != self._screen_size:
+            # First frame or a resize: paint everything from the cached static layer
+            with self.profiler.phase("board_draw"):
+                screen.blit(board.static_layer(screen), (0, 0))
+                self._cells = {}
+                for (x, y), unit in sorted(current.items(), key=lambda item: (item[0][1], item[0][0])):
+                    self._cells[(x, y)] = (self._signature(unit), board.draw_unit(screen, unit, x, y))
+            self._projectile_rects = projectiles.draw(screen)
+            self._screen_size = screen.get_size()
+            return [screen.get_rect()]
+
+        # Rects to wipe back to the static layer: last frame's projectiles, every changed cell's
+        # old rect and the rect it is about to cover
+        wiped = list(self._projectile_rects)
+        changed = set()
+        for cell, (signature, rect) in self._cells.items():
+            unit = current.get(cell)
+            if unit is None or self._signature(unit) != signature:
+                wiped.append(rect)
+        for cell, unit in current.items():
+            previous = self._cells.get(cell)
+            if previous is None or previous[0] != self._signature(unit):
+                changed.add(cell)
+                wiped.append(board.unit_rect(unit, *cell))
+
+        # Sprites are bigger than small cells, so neighbours overlap: an unchanged unit touching a
+        # wiped rect is wiped and repainted too, which can in turn pull in the units overlapping it
+        unchanged = [cell for cell in current if cell not in changed]
+        added = wiped
+        while unchanged and added:
+            overlapping = [cell for cell in unchanged if self._cells[cell][1].collidelist(added) != -1]
+            added = [self._cells[cell][1] for cell in overlapping]
+            changed.update(overlapping)
+            wiped.extend(added)
+            unchanged = [cell for cell in unchanged if cell not in changed]
+
+        with self.profiler.phase("board_draw"):
+            board.erase(screen, wiped)
+            cells = {cell: drawn for cell, drawn in self._cells.items() if cell in current and cell not in changed}
+            redrawn = []
+            for x, y in sorted(changed, key=lambda cell: (cell[1], cell[0])):  # Row-major, like a full draw
+                unit = current[(x, y)]
+                rect = board.draw_unit(screen, unit, x, y)
+                cells[(x, y)] = (self._signature(unit), rect)
+                redrawn.append(rect)
+
+        projectile_rects = projectiles.draw(screen)
+        self._cells = cells
+        self._projectile_rects = projectile_rects
+        return wiped + redrawn + projectile_rects
+
+
+RENDERERS = {"full": FullRenderer, "dirty": DirtyRectRenderer}
@@ -0,0 +1,234 @@
+# replay.py
+#
+# Compact binary match recordings. A file is a small header, fixed-size records streamed
+# as the match plays, and a trailer written when the recording is closed. A reader
+# memory-maps the file and walks the records without copying them.
+#
+# Every keyframe_interval ticks the recorder also writes a keyframe: a KEYFRAME marker
+# followed by a SNAPSHOT and a MANA record for every live unit, so a player can seek by
+# restoring the nearest keyframe and applying only the records after it.
+#
+# Header: b"BFRP", version (u16), tick rate (f32), board width and height (u16 each) and
+# the file offset of the trailer (u64, 0 until the recording is closed).
+# Trailer: species count (u16), one length-prefixed UTF-8 class name per species, then
+# keyframe count (u32) and one (tick, record index) pair of u32s per keyframe.
+
+import bisect
+import mmap
+import struct
+
+import combat_log
+from combat_log import CombatLog, DEBUG
+
+MAGIC = b"BFRP"
+VERSION = 2
+HEADER = struct.Struct("<4sHfHHQ")
+SPECIES_COUNT = struct.Struct("<H")
+NAME_LENGTH = struct.Struct("<B")
+KEYFRAME_COUNT = struct.Struct("<I")
+KEYFRAME_ENTRY = struct.Struct("<II")
+KEYFRAME_INTERVAL = 150  # Ticks between keyframes (5 s at 30 ticks per second)
+
+# tick, kind, aux, unit, other, x, y, value
+RECORD = struct.Struct("<IBBHHhhf")
+
+# Record kinds. `other` is the target unit for ATTACK/CRIT/PROJECTILE/ABILITY and the species for SPAWN;
+# `aux` is the team for SPAWN; `value` is damage, health or mana depending on the kind.
+SPAWN = 1  # x, y = cell; value = health
+MOVE = 2  # x, y = new cell
+ATTACK = 3  # value = damage dealt
+CRIT = 4  # value = critical part of the damage
+DAMAGE = 5  # value = health after the hit
+MANA = 6  # value = current mana
+DEATH = 7
+PROJECTILE = 8  # x, y = pixel start; value = speed
+KEYFRAME = 9  # unit = number of units in the snapshot that follows
+SNAPSHOT = 10  # Full unit state inside a keyframe; fields as for SPAWN
+ABILITY = 11  # other = target, if any; followed by a MANA record with the spent mana
+
+KIND_NAMES = {SPAWN: "spawn", MOVE: "move", ATTACK: "attack", CRIT: "crit", DAMAGE: "damage",
+              MANA: "mana", DEATH: "death", PROJECTILE: "projectile", KEYFRAME: "keyframe",
+              SNAPSHOT: "snapshot", ABILITY: "ability"}
+
+NO_UNIT = 0xFFFF
+
+
+class ReplayRecorder:
+    """Writes one match as fixed-size binary records.
+
+    Combat events arrive as a combat log writer; spawns, moves and projectiles come from
+    hooks in Simulation. Units are identified by their unit registry ids.
+    """
+
+    def __init__(self, path, simulation, keyframe_interval=KEYFRAME_INTERVAL):
+        self.simulation = simulation
+        self.file = open(path, "wb")
+        self.species = []
+        self._species_index = {}
+        self.keyframe_interval = keyframe_interval
+        self.keyframes = []  # (tick, record index) of every keyframe written
+        self._record_count = 0
+
+        board = simulation.board
+        self.file.write(HEADER.pack(MAGIC, VERSION, simulation.clock.tick_rate,
+                                    board.grid_width, board.grid_height, 0))
+
+        # Recording needs every event, including DEBUG mana gains
+        if not simulation.log.enabled:
+            simulation.set_log(CombatLog(level=DEBUG, capacity=1))
+        simulation.log.level = min(simulation.log.level, DEBUG)
+        simulation.log.add_writer(self)
+        simulation.recorder = self
+
+        for unit in simulation.units:
+            self.spawn(unit)
+        self.keyframe()
+
+    @staticmethod
+    def _unit_id(unit):
+        return NO_UNIT if unit is None else unit.uid
+
+    def _species_id(self, unit):
+        name = type(unit).__name__
+        if name not in self._species_index:
+            self._species_index[name] = len(self.species)
+            self.species.append(name)
+        return self._species_index[name]
+
+    def _write(self, kind, unit, other=NO_UNIT, x=0, y=0, value=0.0, aux=0):
+        self.file.write(RECORD.pack(self.simulation.clock.ticks, kind, aux, self._unit_id(unit), other, x, y, value))
+        self._record_count += 1
+
+    def spawn(self, unit, kind=SPAWN):
+        team = unit.team if isinstance(unit.team, int) and 0 <= unit.team < 256 else 255
+        self._write(kind, unit, self._species_id(unit), unit.x, unit.y, unit.health, aux=team)
+
+    def keyframe(self):
+        """Snapshot every live unit so playback can start from here."""
+        live = [unit for unit in self.simulation.units if unit.health > 0]
+        self.keyframes.append((self.simulation.clock.ticks, self._record_count))
+        self.file.write(RECORD.pack(self.simulation.clock.ticks, KEYFRAME, 0, len(live), NO_UNIT, 0, 0, 0.0))
+        self._record_count += 1
+        for unit in live:
+            self.spawn(unit, SNAPSHOT)
+            self._write(MANA, unit, value=unit.current_mana)
+
+    def tick(self):
+        """Called by the simulation after every step; writes a keyframe when one is due."""
+        if self.simulation.clock.ticks - self.keyframes[-1][0] >= self.keyframe_interval:
+            self.keyframe()
+
+    def move(self, unit):
+        self._write(MOVE, unit, NO_UNIT, unit.x, unit.y)
+
+    def projectile(self, unit, target, x, y, speed):
+        self._write(PROJECTILE, unit, self._unit_id(target), int(x), int(y), speed)
+
+    def write(self, event):
+        """Combat log writer: turn structured events into records."""
+        if event.kind == combat_log.ATTACK:
+            self._write(ATTACK, event.source, self._unit_id(event.target), value=event.amount)
+            self._write(DAMAGE, event.target, value=event.target.health)
+        elif event.kind == combat_log.CRIT:
+            self._write(CRIT, event.source, self._unit_id(event.target), value=event.amount)
+        elif event.kind == combat_log.BURN:
+            self._write(DAMAGE, event.target, value=event.target.health)
+        elif event.kind == combat_log.MANA_GAIN:
+            self._write(MANA, event.source, value=event.amount)
+        elif event.kind == combat_log.ABILITY:
+            # Casting spends the owner's mana without a mana event of its own
+            self._write(ABILITY, event.source, self._unit_id(event.target))
+            self._write(MANA, event.source, value=event.source.current_mana)
+        elif event.kind == combat_log.DEATH:
+            self._write(DEATH, event.source)
+
+    def close(self):
+        """Append the trailer (species and keyframe tables), point the header at it and stop recording."""
+        trailer_offset = self.file.tell()
+        self.file.write(SPECIES_COUNT.pack(len(self.species)))
+        for name in self.species:
+            encoded = name.encode("utf-8")
+            self.file.write(NAME_LENGTH.pack(len(encoded)) + encoded)
+        self.file.write(KEYFRAME_COUNT.pack(len(self.keyframes)))
+        for tick, index in self.keyframes:
+            self.file.write(KEYFRAME_ENTRY.pack(tick, index))
+        self.file.seek(HEADER.size - 8)
+        self.file.write(struct.pack("<Q", trailer_offset))
+        self.file.close()
+
+        if self.simulation.recorder is self:
+            self.simulation.recorder = None
+        if self in self.simulation.log.writers:
+            self.simulation.log.writers.remove(self)
+
+
+class ReplayReader:
+    """Memory-maps a recording and iterates its records without copying them.
+
+    Records are (tick, kind, aux, unit, other, x, y, value) tuples; see RECORD.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self._map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        magic, version, self.tick_rate, self.grid_width, self.grid_height, trailer_offset = \
+            HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} BeastFight replay")
+
+        # A recording that was never closed has no trailer; its records run to the end
+        end = trailer_offset if trailer_offset else len(self._view)
+        self._records = self._view[HEADER.size:HEADER.size + (end - HEADER.size) // RECORD.size * RECORD.size]
+        self.species = []
+        self.keyframes = []  # (tick, record index), in tick order
+        if trailer_offset:
+            (species_count,) = SPECIES_COUNT.unpack_from(self._view, trailer_offset)
+            offset = trailer_offset + SPECIES_COUNT.size
+            for _ in range(species_count):
+                (length,) = NAME_LENGTH.unpack_from(self._view, offset)
+                offset += NAME_LENGTH.size
+                self.species.append(bytes(self._view[offset:offset + length]).decode("utf-8"))
+                offset += length
+            (keyframe_count,) = KEYFRAME_COUNT.unpack_from(self._view, offset)
+            self.keyframes = list(KEYFRAME_ENTRY.iter_unpack(
+                self._view[offset + KEYFRAME_COUNT.size:offset + KEYFRAME_COUNT.size + keyframe_count * KEYFRAME_ENTRY.size]))
+        else:
+            self.keyframes = [(record[0], i) for i, record in enumerate(self) if record[1] == KEYFRAME]
+        self._keyframe_ticks = [tick for tick, _ in self.keyframes]
+
+    def __len__(self):
+        return len(self._records) // RECORD.size
+
+    def __iter__(self):
+        return RECORD.iter_unpack(self._records)
+
+    def record(self, index):
+        """The record at a position, read straight from the mapping."""
+        return RECORD.unpack_from(self._records, index * RECORD.size)
+
+    def records_from(self, index):
+        """Iterate records starting at a position."""
+        return RECORD.iter_unpack(self._records[index * RECORD.size:])
+
+    def keyframe_before(self, tick):
+        """(tick, record index) of the last keyframe at or before tick, or None."""
+        position = bisect.bisect_right(self._keyframe_ticks, tick) - 1
+        return self.keyframes[position] if position >= 0 else None
+
+    @property
+    def last_tick(self):
+        return self.record(len(self) - 1)[0] if len(self) else 0
+
+    def close(self):
+        self._records.release()
+        self._view.release()
+        self._map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
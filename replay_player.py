@@ -0,0 +1,160 @@
+# replay_player.py
+#
+# Plays back a recorded match and seeks anywhere in it. Seeking restores the last
+# keyframe at or before the target tick and applies only the records after it, so
+# jumping around a long match costs at most one keyframe interval of records.
+#
+#     python replay_player.py match.bfr
+#
+# Space pauses, Left/Right seek 5 seconds, Up/Down change the playback speed.
+
+import sys
+
+import pygame
+
+import replay
+import unit as unit_module
+from player_board import PlayerBoard
+
+SEEK_STEP = 5.0  # Seconds moved by one arrow key press
+
+
+class ReplayPlayer:
+    """Rebuilds board state from a replay file and draws it through PlayerBoard."""
+
+    def __init__(self, path, screen_width, screen_height):
+        self.reader = replay.ReplayReader(path)
+        self.board = PlayerBoard(screen_width, screen_height, self.reader.grid_width, self.reader.grid_height)
+        self.units = {}  # record id -> unit rebuilt from the replay
+        self.tick = 0
+        self._cursor = 0  # Index of the next record to apply
+        self.seek(0)
+
+    @property
+    def tick_rate(self):
+        return self.reader.tick_rate
+
+    @property
+    def time(self):
+        return self.tick / self.reader.tick_rate
+
+    @property
+    def duration(self):
+        return self.reader.last_tick / self.reader.tick_rate
+
+    def _spawn(self, unit_id, species, team, x, y, health):
+        unit = getattr(unit_module, self.reader.species[species])()
+        unit.team = team
+        unit.x, unit.y = x, y
+        unit.health = health
+        self.units[unit_id] = unit
+
+    def _apply(self, record):
+        _, kind, aux, unit_id, other, x, y, value = record
+        if kind == replay.SPAWN or kind == replay.SNAPSHOT:
+            self._spawn(unit_id, other, aux, x, y, value)
+        elif kind == replay.KEYFRAME:
+            self.units = {}  # The snapshot that follows is the full board
+            return
+        unit = self.units.get(unit_id)
+        if unit is None:
+            return
+        if kind == replay.MOVE:
+            unit.x, unit.y = x, y
+        elif kind == replay.DAMAGE:
+            unit.health = value
+        elif kind == replay.MANA:
+            unit.current_mana = value
+        elif kind == replay.DEATH:
+            del self.units[unit_id]
+
+    def _apply_until(self, tick):
+        """Apply every record up to and including tick, starting at the cursor."""
+        for record in self.reader.records_from(self._cursor):
+            if record[0] > tick:
+                break
+            self._apply(record)
+            self._cursor += 1
+        self.tick = tick
+
+    def seek(self, tick):
+        """Move playback to tick, going through the nearest keyframe when that is shorter."""
+        tick = max(0, tick)
+        keyframe = self.reader.keyframe_before(tick)
+        if tick < self.tick or (keyframe is not None and keyframe[1] > self._cursor):
+            self.units = {}
+            self._cursor = keyframe[1] if keyframe is not None else 0
+        self._apply_until(tick)
+
+    def seek_time(self, seconds):
+        self.seek(round(seconds * self.reader.tick_rate))
+
+    def advance(self, ticks):
+        """Play forward by a number of ticks."""
+        self._apply_until(self.tick + ticks)
+
+    def sync_board(self):
+        """Put the rebuilt units on the board grid."""
+        self.board.reset_units(self.units.values())
+
+    def draw(self, screen):
+        self.sync_board()
+        return self.board.draw(screen)
+
+    def close(self):
+        self.reader.close()
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("usage: python replay_player.py match.bfr")
+        return
+
+    pygame.init()
+    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    screen_width, screen_height = screen.get_size()
+    pygame.display.set_caption("Beastfight Fanatics - Replay")
+    player = ReplayPlayer(sys.argv[1], screen_width, screen_height)
+    font = pygame.font.Font(None, 36)
+
+    clock = pygame.time.Clock()
+    speed = 1.0
+    paused = False
+    elapsed = 0.0  # Playback time not yet turned into ticks
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    paused = not paused
+                elif event.key == pygame.K_LEFT:
+                    player.seek_time(player.time - SEEK_STEP)
+                elif event.key == pygame.K_RIGHT:
+                    player.seek_time(player.time + SEEK_STEP)
+                elif event.key == pygame.K_UP:
+                    speed = min(speed * 2, 16.0)
+                elif event.key == pygame.K_DOWN:
+                    speed = max(speed / 2, 0.25)
+
+        frame_time = clock.tick(30) / 1000.0
+        if not paused:
+            elapsed += frame_time * speed
+            ticks = int(elapsed * player.tick_rate)
+            elapsed -= ticks / player.tick_rate
+            player.advance(ticks)
+
+        player.draw(screen)
+        status = f"{player.time:6.1f}s / {player.duration:.1f}s  x{speed:g}" + ("  paused" if paused else "")
+        screen.blit(font.render(status, True, (255, 255, 255)), (20, 15))
+        pygame.display.flip()
+
+    player.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
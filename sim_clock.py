@@ -0,0 +1,32 @@
+TICK_RATE = 30  # Simulation ticks per second, matching the live game's frame rate
+MAX_CATCH_UP_TICKS = 10  # Cap on ticks run for one real-time frame so a stall can't snowball
+
+
+class SimulationClock:
+    """Fixed-timestep clock. Simulation time only moves when the clock is ticked."""
+
+    def __init__(self, tick_rate=TICK_RATE):
+        self.tick_rate = tick_rate
+        self.dt = 1 / tick_rate  # Seconds of simulation time per tick
+        self.ticks = 0
+        self._accumulator = 0.0  # Real time not yet turned into ticks
+
+    @property
+    def now(self):
+        """Current simulation time in seconds."""
+        return self.ticks * self.dt
+
+    def tick(self):
+        """Advance the clock by one fixed step and return the new time."""
+        self.ticks += 1
+        return self.now
+
+    def advance(self, elapsed, max_ticks=MAX_CATCH_UP_TICKS):
+        """Accumulate real elapsed seconds and return how many whole ticks are now due."""
+        self._accumulator += elapsed
+        due = int(self._accumulator / self.dt)
+        self._accumulator -= due * self.dt
+        if due > max_ticks:
+            due = max_ticks
+            self._accumulator = 0.0  # Drop the backlog instead of fast-forwarding through it
+        return due
@@ -0,0 +1,186 @@
+import random
+
+from pathfinding import FlowFields
+from player_board import PlayerBoard
+from Projectile import ProjectilePool, CLOSE_PROJECTILE_IMAGE, RANGED_PROJECTILE_IMAGE
+from combat_log import NULL_LOG, INFO, DEATH
+from sim_clock import SimulationClock
+from status_effects import StatusEffects
+from unit import UNIT_IMAGE_SIZE
+from unit_registry import UnitRegistry
+
+HEADLESS_SCREEN_SIZE = (1920, 1080)  # Board geometry used when no window exists
+INITIAL_PAUSE = 1.5  # Seconds before the first movement and attack
+ACTION_INTERVAL = 0.75  # Seconds between movement steps once the fight has started
+PROJECTILE_SPEED = 5  # Pixels per tick
+
+
+class Simulation:
+    """Pure combat logic: board, units, movement, combat and projectiles, with no rendering or asset I/O."""
+
+    def __init__(self, board=None, clock=None, seed=None, log=None, projectiles=None):
+        # A headless board still has pixel geometry so projectiles can be simulated as plain data
+        self.board = board if board is not None else PlayerBoard(*HEADLESS_SCREEN_SIZE)
+        self.clock = clock if clock is not None else SimulationClock()
+        self.rng = random.Random(seed)  # Seeded fights replay identically
+        self.log = log if log is not None else NULL_LOG  # Structured combat events; off by default
+        self.units = UnitRegistry()  # By team, with stable ids; deaths leave at the end of the tick
+        # Live projectiles; a ProjectileBatch (projectile_batch.py) moves them all in one NumPy step
+        self.projectiles = projectiles if projectiles is not None else ProjectilePool()
+        self.effects = StatusEffects(self.log)  # Burns, stuns and buffs, ticked by the simulation clock
+        self.recorder = None  # Optional ReplayRecorder told about spawns, moves and projectiles
+
+        # Timer for controlling movement frequency, in simulation seconds
+        self.last_action_time = self.clock.now
+        self.action_interval = INITIAL_PAUSE  # Start with 1.5-second delay
+
+    def add_unit(self, unit, x, y, team=None):
+        """Add a unit to the fight and place it on the board."""
+        if team is not None:
+            unit.team = team
+        unit.last_attack_time = self.clock.now  # Attack timers start when the unit joins the fight
+        self.units.add(unit)
+        self.board.place_unit(unit, x, y)
+        self.projectiles.track(unit)
+        if self.recorder is not None:
+            self.recorder.spawn(unit)
+
+    def set_log(self, log):
+        """Swap the combat log, including the one status effects report to."""
+        self.log = log
+        self.effects.log = log
+
+    def add_lineup(self, units, team, y):
+        """Place a team's units side by side, centred on row y."""
+        start_x = max(0, (self.board.grid_width - len(units)) // 2)
+        for i, unit in enumerate(units):
+            self.add_unit(unit, x=(start_x + i) % self.board.grid_width, y=y, team=team)
+
+    def calculate_distance(self, unit, target):
+        """Calculate Manhattan distance between two units (diagonal counts as 2 units)."""
+        dx = abs(unit.x - target.x)
+        dy = abs(unit.y - target.y)
+        return dx + dy if dx == 0 or dy == 0 else dx + dy + 1
+
+    def find_nearest_target(self, unit):
+        """Find the nearest enemy unit for a given unit via the board's spatial index."""
+        return self.board.nearest_enemy(unit)
+
+    def execute_movement(self):
+        """Move each unit out of combat one step along its team's flow field toward the enemy."""
+        now = self.clock.now
+        fields = FlowFields(self.board)  # One distance field per team for this step
+        for unit in self.units:
+            if unit.health <= 0 or unit.is_stunned(now):
+                continue  # Skip dead and stunned units
+
+            # Check if there is any target in range
+            in_combat = self.board.enemy_in_range(unit) is not None
+
+            # Step towards the nearest enemy if not in combat; the field only offers free cells
+            if not in_combat:
+                step = fields.next_step(unit)
+                if step is not None:
+                    self.board.place_unit(unit, *step)
+                    self.projectiles.track(unit)
+                    if self.recorder is not None:
+                        self.recorder.move(unit)
+
+    def start_combat(self):
+        """Combat loop: Units attempt to attack if in range."""
+        for unit in self.units:
+            if unit.health <= 0:
+                continue  # Skip defeated units
+
+            # Normal attack on enemies
+            for target in self.board.enemies_in_range(unit):
+                if unit.attack_enemy(target, self.clock.now, self.effects, self.rng, self.log):
+                    self.spawn_projectile(unit, target)
+
+                if target.health <= 0:  # Handle target death
+                    self.handle_unit_death(target)
+
+    def spawn_projectile(self, unit, target):
+        """Create the projectile that visualises an attack from unit to target."""
+        projectile_image = CLOSE_PROJECTILE_IMAGE if unit.attack_range == "close" else RANGED_PROJECTILE_IMAGE
+        board = self.board
+        start_x = unit.x * board.cell_size + board.offset_x + (UNIT_IMAGE_SIZE[0] // 2) - (32 // 2)
+        start_y = unit.y * board.cell_size + board.offset_y + (UNIT_IMAGE_SIZE[1] // 2) - (32 // 2)
+        projectile = self.projectiles.spawn(
+            image_path=projectile_image,
+            start_x=start_x,  # Centred on the unit, adjusted for projectile size (e.g., 32x32)
+            start_y=start_y,
+            target_unit=target,
+            cell_size=board.cell_size,
+            offset_x=board.offset_x,
+            offset_y=board.offset_y,
+            speed=PROJECTILE_SPEED
+        )
+        if self.recorder is not None:
+            self.recorder.projectile(unit, target, start_x, start_y, PROJECTILE_SPEED)
+        return projectile
+
+    def handle_unit_death(self, unit):
+        """Take a defeated unit off the grid now and out of the unit registry at the end of the tick."""
+        if unit.health <= 0:
+            if self.log.enabled:
+                self.log.emit(self.clock.now, INFO, DEATH, unit)
+            # Clear the grid position for the defeated unit
+            self.board.remove_unit(unit)
+            # Leave the registry once this tick's loops over it are done
+            self.units.remove_later(unit)
+
+    def update_effects(self):
+        """Run every status effect tick that is due and clear out anything it killed."""
+        for effect in self.effects.update(self.clock.now):
+            target = effect.target
+            if target.health <= 0 and target in self.units:
+                self.handle_unit_death(target)
+
+    def update_projectiles(self):
+        """Advance projectiles and recycle those that hit their target."""
+        self.projectiles.update()
+
+    def step(self):
+        """Advance the fight by one clock tick: movement when due, then combat and projectiles."""
+        now = self.clock.tick()
+
+        # Initial pause logic
+        if now < INITIAL_PAUSE:
+            return
+
+        self.update_effects()
+
+        if now - self.last_action_time >= self.action_interval:
+            self.action_interval = ACTION_INTERVAL  # Update interval after the initial pause
+            self.last_action_time = now
+            self.execute_movement()
+
+        self.start_combat()
+        self.update_projectiles()
+        self.end_tick()
+
+    def end_tick(self):
+        """Bookkeeping once a tick's work is done: drop the dead and let the recorder keyframe."""
+        self.units.flush()
+        if self.recorder is not None:
+            self.recorder.tick()
+
+    def run(self, max_time=120.0):
+        """Step the fight as fast as possible until it ends or max_time simulated seconds pass."""
+        while not self.is_finished() and self.clock.now < max_time:
+            self.step()
+        return self.clock.now
+
+    def alive_teams(self):
+        """Teams that still have a unit standing; teamless units count as a team of one."""
+        return self.units.alive_teams()
+
+    def is_finished(self):
+        """A fight is over once fewer than two teams are still standing."""
+        return len(self.alive_teams()) < 2
+
+    def winner(self):
+        """The last team standing, or None while the fight is undecided."""
+        teams = self.alive_teams()
+        return next(iter(teams)) if len(teams) == 1 else None
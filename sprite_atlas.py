@@ -0,0 +1,98 @@
+# sprite_atlas.py
+#
+# Packs the per-beast star-level sprites into one atlas image plus a JSON index.
+# Build it once after changing any sprite:
+#
+#     python sprite_atlas.py
+
+import json
+import math
+import os
+import re
+
+import pygame
+
+from assets import sprite_key
+from unit import UNIT_IMAGE_SIZE
+from unit_catalog import catalog
+
+ATLAS_SOURCE_DIRS = (
+    "BF_FireCharactersNew",
+    "BF_GrassCharactersNew",
+    "BF_DarkCharacters",
+    "BF_WaterCharacters",
+)
+ATLAS_IMAGE_PATH = "sprite_atlas.png"
+ATLAS_INDEX_PATH = "sprite_atlas.json"
+SPRITE_FILE = re.compile(r"^[a-z]{3}\d\.png$", re.IGNORECASE)  # e.g. phe1.png, Scr3.png
+
+
+def build_atlas(source_dirs=ATLAS_SOURCE_DIRS, image_path=ATLAS_IMAGE_PATH, index_path=ATLAS_INDEX_PATH,
+                cell_size=UNIT_IMAGE_SIZE):
+    """Scale every sprite to cell_size, pack them row by row into one image and write the index."""
+    sprite_paths = sorted(
+        os.path.join(directory, name)
+        for directory in source_dirs
+        for name in os.listdir(directory)
+        if SPRITE_FILE.match(name)
+    )
+    columns = max(1, math.ceil(math.sqrt(len(sprite_paths))))
+    rows = max(1, math.ceil(len(sprite_paths) / columns))
+    cell_width, cell_height = cell_size
+
+    atlas = pygame.Surface((columns * cell_width, rows * cell_height), pygame.SRCALPHA)
+    index = {"cell_size": list(cell_size), "sprites": {}}
+    for i, path in enumerate(sprite_paths):
+        x, y = (i % columns) * cell_width, (i // columns) * cell_height
+        atlas.blit(pygame.transform.scale(pygame.image.load(path), cell_size), (x, y))
+        index["sprites"][sprite_key(path)] = [x, y, cell_width, cell_height]
+
+    pygame.image.save(atlas, image_path)
+    with open(index_path, "w") as f:
+        json.dump(index, f, sort_keys=True)
+    return len(sprite_paths)
+
+
+def unresolved_unit_sprites(index_path=ATLAS_INDEX_PATH):
+    """(species, sprite key) for every catalog unit whose sprite the atlas doesn't contain."""
+    with open(index_path) as f:
+        packed = json.load(f)["sprites"]
+    keys = [(name, catalog().template(name).sprite_key) for name in catalog()]
+    return [(name, key) for name, key in keys if key not in packed]
+
+
+class SpriteAtlas:
+    """One packed surface plus the sub-rect of every sprite in it."""
+
+    def __init__(self, surface, rects, cell_size):
+        self.surface = surface
+        self.rects = rects
+        self.cell_size = cell_size
+        self._sprites = {}
+
+    @classmethod
+    def load(cls, image_path=ATLAS_IMAGE_PATH, index_path=ATLAS_INDEX_PATH):
+        """Read the atlas image and index, or return None if the atlas hasn't been built."""
+        if not (os.path.exists(image_path) and os.path.exists(index_path)):
+            return None
+        with open(index_path) as f:
+            index = json.load(f)
+        surface = pygame.image.load(image_path)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        rects = {key: pygame.Rect(rect) for key, rect in index["sprites"].items()}
+        return cls(surface, rects, tuple(index["cell_size"]))
+
+    def sprite(self, key):
+        """Subsurface for a sprite key (see assets.sprite_key), or None if the atlas doesn't contain it."""
+        if key not in self._sprites:
+            rect = self.rects.get(key)
+            self._sprites[key] = self.surface.subsurface(rect) if rect is not None else None
+        return self._sprites[key]
+
+
+if __name__ == "__main__":
+    count = build_atlas()
+    print(f"Packed {count} sprites into {ATLAS_IMAGE_PATH} ({ATLAS_INDEX_PATH})")
+    for name, key in unresolved_unit_sprites():
+        print(f"No sprite for {name}: no '{key}' in {', '.join(ATLAS_SOURCE_DIRS)}")
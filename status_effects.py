@@ -0,0 +1,124 @@
+import heapq
+import itertools
+
+from combat_log import NULL_LOG, INFO, BURN
+
+MIN_ATTACK_SPEED = 0.5  # Buffs never push attack_speed below this
+
+
+class StatusEffect:
+    """A timed effect on one unit. start() applies it; tick() runs each time it comes due.
+
+    Both return the simulation time of the next tick, or None once the effect is over.
+    """
+
+    def __init__(self, target):
+        self.target = target
+
+    def start(self, now, log=NULL_LOG):
+        return None
+
+    def tick(self, now, log=NULL_LOG):
+        return None
+
+
+class DamageOverTime(StatusEffect):
+    """Deal damage_per_tick right away and then every interval seconds, ticks times in total."""
+
+    def __init__(self, target, damage_per_tick, interval, ticks):
+        super().__init__(target)
+        self.damage_per_tick = damage_per_tick
+        self.interval = interval
+        self.remaining = ticks
+
+    def start(self, now, log=NULL_LOG):
+        return self.tick(now, log)
+
+    def tick(self, now, log=NULL_LOG):
+        target = self.target
+        if self.remaining <= 0 or target.health <= 0:
+            return None  # Burn ran out or the target is already down
+        target.health -= self.damage_per_tick
+        if log.enabled:
+            log.emit(now, INFO, BURN, None, target, self.damage_per_tick)
+        if target.health <= 0:
+            target.health = 0  # Clamp health to 0
+        self.remaining -= 1
+        return now + self.interval if self.remaining > 0 else None
+
+
+class Stun(StatusEffect):
+    """Keep the target from moving or attacking for duration seconds."""
+
+    def __init__(self, target, duration):
+        super().__init__(target)
+        self.duration = duration
+
+    def start(self, now, log=NULL_LOG):
+        self.target.stunned_until = max(self.target.stunned_until, now + self.duration)
+        return None  # Expiry is just a time comparison, no event needed
+
+
+class StatBuff(StatusEffect):
+    """Add to attack damage and attack speed, for duration seconds or (duration None) the rest of the fight."""
+
+    def __init__(self, target, attack_damage=0, attack_speed=0, duration=None):
+        super().__init__(target)
+        self.attack_damage = attack_damage
+        self.attack_speed = attack_speed
+        self.duration = duration
+        self._applied_speed = 0
+
+    def start(self, now, log=NULL_LOG):
+        target = self.target
+        target.attack_damage += self.attack_damage
+        new_speed = max(MIN_ATTACK_SPEED, target.attack_speed + self.attack_speed)
+        self._applied_speed = new_speed - target.attack_speed  # Remember what the floor let through
+        target.attack_speed = new_speed
+        return now + self.duration if self.duration is not None else None
+
+    def tick(self, now, log=NULL_LOG):
+        self.target.attack_damage -= self.attack_damage
+        self.target.attack_speed -= self._applied_speed
+        return None
+
+
+class StatusEffects:
+    """Every active effect on a heap keyed by its next due time, advanced by the simulation tick."""
+
+    def __init__(self, log=NULL_LOG):
+        self._queue = []
+        self._order = itertools.count()  # Ties fire in the order effects were added
+        self.log = log  # Effects report their ticks here
+
+    def __len__(self):
+        return len(self._queue)
+
+    def add(self, effect, now):
+        """Apply an effect and schedule its next tick, if it has one."""
+        self._schedule(effect, effect.start(now, self.log))
+
+    def _schedule(self, effect, due):
+        if due is not None:
+            heapq.heappush(self._queue, (due, next(self._order), effect))
+
+    def next_due(self):
+        """Time of the earliest pending tick, or None when nothing is scheduled."""
+        return self._queue[0][0] if self._queue else None
+
+    def due(self, now):
+        """Pop and yield each effect whose tick is due, in time order."""
+        while self._queue and self._queue[0][0] <= now:
+            yield heapq.heappop(self._queue)[2]
+
+    def fire(self, effect, now):
+        """Run one due tick of an effect and reschedule it if it continues."""
+        self._schedule(effect, effect.tick(now, self.log))
+
+    def update(self, now):
+        """Fire everything due by now; returns the effects that ran."""
+        fired = []
+        for effect in self.due(now):
+            self.fire(effect, now)
+            fired.append(effect)
+        return fired
@@ -0,0 +1,107 @@
+# unit_catalog.py
+#
+# Every species' stats live in units.json, one row per species. The catalog reads the
+# file on first use and indexes it by species, class type and trait; a species' template
+# and Unit subclass are only built when something asks for that species, so a process
+# holds just the species it actually fights with. unit.py serves the classes by name:
+#
+#     from unit import Dragon                      # built on first use
+#     catalog().by_trait("Sharpshooter")           # -> ("Phoenix", "Dragon", ...)
+#     catalog().create("Lion")                     # same as unit.Lion()
+
+import json
+import os
+from functools import lru_cache
+
+import Ability
+from attack_range import normalize_range
+from unit import Unit, UnitTemplate
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "units.json")
+
+
+def _split(text):
+    """'Mythical, Sharpshooter' -> ['Mythical', 'Sharpshooter']."""
+    return [part.strip() for part in text.split(",") if part.strip()]
+
+
+class UnitCatalog:
+    """The species in a catalog file. Species are keyed by their class name, e.g. 'Phoenix'."""
+
+    def __init__(self, path=CATALOG_PATH):
+        with open(path) as f:
+            data = json.load(f)
+        columns = data["columns"]
+        self._template_columns = [columns.index(field) for field in UnitTemplate._fields]
+        self._ability_column = columns.index("ability")
+        self.species = [row[0] for row in data["species"]]  # Species id -> name, in file order
+        self._rows = {row[0]: row for row in data["species"]}
+        self._ids = {name: i for i, name in enumerate(self.species)}
+        self._by_class_type = {}
+        self._by_trait = {}
+        class_type, trait = columns.index("class_type"), columns.index("trait")
+        for row in data["species"]:
+            for key in _split(row[class_type]):
+                self._by_class_type.setdefault(key, []).append(row[0])
+            for key in _split(row[trait]):
+                self._by_trait.setdefault(key, []).append(row[0])
+        self._templates = {}
+        self._classes = {}
+
+    def species_id(self, name):
+        return self._ids[name]
+
+    def by_class_type(self, class_type):
+        """Names of the species of a class type, e.g. 'Fire', in file order."""
+        return tuple(self._by_class_type.get(class_type, ()))
+
+    def by_trait(self, trait):
+        return tuple(self._by_trait.get(trait, ()))
+
+    def template(self, name):
+        """The shared UnitTemplate of a species; raises KeyError for unknown species."""
+        template = self._templates.get(name)
+        if template is None:
+            row = self._rows[name]
+            template = UnitTemplate(*(row[i] for i in self._template_columns))
+            template = template._replace(attack_range=normalize_range(template.attack_range))
+            self._templates[name] = template
+        return template
+
+    def unit_class(self, name):
+        """The Unit subclass for a species, created the first time it is asked for."""
+        cls = self._classes.get(name)
+        if cls is None:
+            template = self.template(name)
+            ability_name = self._rows[name][self._ability_column]
+            ability_class = getattr(Ability, ability_name) if ability_name else None
+
+            def __init__(self):
+                Unit.__init__(self, template=template)
+                if ability_class is not None:
+                    self.ability = ability_class(self)
+
+            # Module "unit" so the classes pickle by name and unit.Phoenix resolves back to them
+            cls = self._classes[name] = type(name, (Unit,), {
+                "__slots__": (), "__init__": __init__, "__module__": "unit", "__qualname__": name,
+            })
+        return cls
+
+    def create(self, name):
+        """A fresh unit of a species."""
+        return self.unit_class(name)()
+
+    def __contains__(self, name):
+        return name in self._rows
+
+    def __iter__(self):
+        return iter(self.species)
+
+    def __len__(self):
+        return len(self.species)
+
+
+@lru_cache(maxsize=None)
+def catalog(path=CATALOG_PATH):
+    """The catalog for a file, loaded once per process."""
+    return UnitCatalog(path)
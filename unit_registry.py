@@ -0,0 +1,79 @@
+class UnitRegistry:
+    """The units in a fight, grouped by team.
+
+    Every unit gets a stable integer id (unit.uid) when it joins. Each team keeps its
+    members in a dense list and removal moves the team's last unit into the gap, so it
+    is O(1) but reorders that team. Iteration goes team by team, in the order the teams
+    first joined. Deaths are queued with remove_later() and applied by flush() at the
+    end of the tick, so a loop over the registry never sees it change underneath it.
+    """
+
+    def __init__(self):
+        self.teams = {}  # team key -> list of members
+        self._team_index = {}  # team key -> position in join order
+        self._slots = {}  # uid -> index in its team's list
+        self._by_uid = {}  # uid -> unit, for every unit still registered
+        self._pending = {}  # uid -> unit waiting for flush()
+        self._next_uid = 0
+
+    @staticmethod
+    def team_key(unit):
+        """The team a unit counts for; teamless units are a team of one."""
+        return unit.team if unit.team is not None else id(unit)
+
+    def add(self, unit):
+        """Register a unit and return its new id."""
+        unit.uid = self._next_uid
+        self._next_uid += 1
+        key = self.team_key(unit)
+        members = self.teams.get(key)
+        if members is None:
+            members = self.teams[key] = []
+            self._team_index[key] = len(self._team_index)
+        self._slots[unit.uid] = len(members)
+        members.append(unit)
+        self._by_uid[unit.uid] = unit
+        return unit.uid
+
+    def get(self, uid):
+        return self._by_uid.get(uid)
+
+    def remove(self, unit):
+        """Drop a unit now by swapping its team's last member into its slot."""
+        members = self.teams[self.team_key(unit)]
+        slot = self._slots.pop(unit.uid)
+        last = members.pop()
+        if last is not unit:
+            members[slot] = last
+            self._slots[last.uid] = slot
+        del self._by_uid[unit.uid]
+        self._pending.pop(unit.uid, None)
+
+    def remove_later(self, unit):
+        """Queue a unit for removal at the next flush(); it no longer counts as registered."""
+        self._pending[unit.uid] = unit
+
+    def flush(self):
+        """Apply the queued removals."""
+        if self._pending:
+            for unit in list(self._pending.values()):
+                self.remove(unit)
+
+    def order(self, unit):
+        """Sort key giving the unit's position in iteration order."""
+        return self._team_index[self.team_key(unit)], self._slots[unit.uid]
+
+    def alive_teams(self):
+        """Teams that still have a unit standing."""
+        return {key for key, members in self.teams.items() if any(unit.health > 0 for unit in members)}
+
+    def __iter__(self):
+        for members in self.teams.values():
+            yield from members
+
+    def __len__(self):
+        return len(self._by_uid)
+
+    def __contains__(self, unit):
+        uid = getattr(unit, "uid", None)
+        return self._by_uid.get(uid) is unit and uid not in self._pending